@@ -9,10 +9,21 @@ import requests
 import re
 import html
 import json
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 from bs4 import BeautifulSoup
 
 
+# 请求超时：基础秒数，另按请求文本长度追加（译文越长，生成耗时越久）
+_BASE_TIMEOUT = 60
+_CHARS_PER_EXTRA_SECOND = 100
+
+
+def _timeout_for(text: str) -> float:
+    """按请求文本长度估算的超时秒数"""
+    return _BASE_TIMEOUT + len(text) / _CHARS_PER_EXTRA_SECOND
+
+
 class NVIDIATranslator:
     """NVIDIA minimax 翻译客户端"""
 
@@ -212,7 +223,7 @@ Rules:
         for attempt in range(max_retries):
             try:
                 response = requests.post(
-                    self.base_url, headers=headers, json=payload, timeout=60
+                    self.base_url, headers=headers, json=payload, timeout=_timeout_for(prompt)
                 )
 
                 if response.status_code == 200:
@@ -252,6 +263,189 @@ Rules:
         print(f"    Error: Translation failed after {max_retries} attempts")
         return None
 
+    def translate_many(
+        self, texts: List[str], max_retries: int = 3, max_workers: int = 4
+    ) -> List[Optional[str]]:
+        """
+        并发翻译多段文本
+
+        Args:
+            texts: 要翻译的文本列表
+            max_retries: 每段文本的最大重试次数
+            max_workers: 同时进行的翻译请求数
+
+        Returns:
+            与输入顺序一致的翻译结果列表，失败项为None
+        """
+        if not texts:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(texts))) as executor:
+            return list(
+                executor.map(
+                    lambda text: self.translate_to_chinese(text, max_retries=max_retries),
+                    texts,
+                )
+            )
+
+    def translate_batch(
+        self,
+        texts: List[str],
+        max_retries: int = 3,
+        max_chars_per_req: int = 30000,
+        max_workers: int = 4,
+    ) -> List[Optional[str]]:
+        """
+        打包翻译多段文本，减少请求次数
+
+        按字符预算把文本分组，每组以 JSON 数组发送、要求返回等长数组；
+        返回数量对不上的分组退回逐段翻译。
+
+        Args:
+            texts: 要翻译的文本列表
+            max_retries: 每个请求的最大重试次数
+            max_chars_per_req: 单个请求的字符预算
+            max_workers: 同时进行的翻译请求数
+
+        Returns:
+            与输入顺序一致的翻译结果列表，失败项为None
+        """
+        if not texts:
+            return []
+
+        # Pack consecutive texts into groups of indices within the budget;
+        # an oversized text goes alone
+        groups: List[List[int]] = []
+        current: List[int] = []
+        current_len = 0
+        for i, text in enumerate(texts):
+            if current and current_len + len(text) > max_chars_per_req:
+                groups.append(current)
+                current, current_len = [], 0
+            current.append(i)
+            current_len += len(text)
+        if current:
+            groups.append(current)
+
+        def translate_group(indices: List[int]) -> List[Optional[str]]:
+            if len(indices) == 1:
+                return [self.translate_to_chinese(texts[indices[0]], max_retries=max_retries)]
+
+            translated = self._translate_segments(
+                [texts[i] for i in indices], max_retries=max_retries
+            )
+            if translated is not None:
+                return translated
+            return [self.translate_to_chinese(texts[i], max_retries=max_retries) for i in indices]
+
+        results: List[Optional[str]] = [None] * len(texts)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+            for indices, translations in zip(groups, executor.map(translate_group, groups)):
+                for i, translation in zip(indices, translations):
+                    results[i] = translation
+        return results
+
+    def _translate_segments(
+        self, segments: List[str], max_retries: int = 3
+    ) -> Optional[List[str]]:
+        """
+        在一个请求中翻译多段文本
+
+        各段作为 JSON 数组发送，要求模型返回同样长度、同样顺序的
+        "translations" 数组，避免依赖分隔符在译文中原样保留。
+
+        Args:
+            segments: 要翻译的文本列表
+            max_retries: 最大重试次数
+
+        Returns:
+            与输入等长的译文列表；请求失败或返回条数不符时返回None
+        """
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+
+        count = len(segments)
+        prompt = f"""Translate each item of the following JSON array to Chinese.
+
+Input ({count} items):
+{json.dumps(segments, ensure_ascii=False)}
+
+Output format (JSON only):
+{{"translations": ["translated item 1", "translated item 2", ...]}}
+
+Rules:
+- Return ONLY the JSON object
+- "translations" must hold exactly {count} strings, one per input item, in input order
+- Never merge, split, drop or reorder items
+- Do NOT include any explanations or thinking process
+- Keep Markdown format
+- Do not translate code blocks or URLs
+- Keep technical terms accurate"""
+
+        payload = {
+            "messages": [{"role": "user", "content": prompt}],
+            "model": self.model,
+            "stream": False,
+            "temperature": 0.3,
+        }
+
+        for attempt in range(max_retries):
+            try:
+                response = requests.post(
+                    self.base_url, headers=headers, json=payload, timeout=_timeout_for(prompt)
+                )
+
+                if response.status_code == 200:
+                    data = response.json()
+                    content = (
+                        data.get("choices", [{}])[0]
+                        .get("message", {})
+                        .get("content", "")
+                        .strip()
+                    )
+                    translations = self._extract_json_translations(content)
+                    if translations is not None and len(translations) == count:
+                        return [t.strip() for t in translations]
+                    # A wrong item count would not improve on a plain retry
+                    got = "no" if translations is None else len(translations)
+                    print(
+                        f"    Warning: Batch split mismatch ({got}/{count}), translating individually"
+                    )
+                    return None
+
+                print(
+                    f"    Warning: Batch translation failed (status {response.status_code}), attempt {attempt + 1}/{max_retries}"
+                )
+            except requests.exceptions.Timeout:
+                print(
+                    f"    Warning: Batch translation timeout, attempt {attempt + 1}/{max_retries}"
+                )
+            except Exception as e:
+                print(
+                    f"    Warning: Batch translation error: {e}, attempt {attempt + 1}/{max_retries}"
+                )
+            if attempt < max_retries - 1:
+                time.sleep(2**attempt)
+
+        return None
+
+    @staticmethod
+    def _extract_json_translations(content: str) -> Optional[List[str]]:
+        """从模型输出中取出 {"translations": [...]} 的字符串数组（跳过前置的思考过程）"""
+        decoder = json.JSONDecoder()
+        for match in re.finditer(r"\{", content or ""):
+            try:
+                result, _ = decoder.raw_decode(content, match.start())
+            except json.JSONDecodeError:
+                continue
+            translations = result.get("translations") if isinstance(result, dict) else None
+            if isinstance(translations, list) and all(isinstance(t, str) for t in translations):
+                return translations
+        return None
+
     def _translate_chunk(self, text: str, max_retries: int) -> Optional[str]:
         """
         翻译单个文本块
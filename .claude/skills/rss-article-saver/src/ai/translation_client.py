@@ -5,7 +5,7 @@ Fallback Translation Client
 
 import os
 import time
-from typing import Optional
+from typing import List, Optional
 
 
 class FallbackTranslator:
@@ -87,3 +87,73 @@ class FallbackTranslator:
                 print(f"  Fallback translator error: {e}")
 
         return None
+
+    def translate_many(
+        self, texts: List[str], max_retries: int = 3, max_workers: int = 4
+    ) -> List[Optional[str]]:
+        """批量翻译内容，主服务失败的条目逐条切换到备用服务"""
+        results: List[Optional[str]] = [None] * len(texts)
+
+        # Try primary first (batched when supported)
+        if self.primary_client:
+            try:
+                if hasattr(self.primary_client, "translate_many"):
+                    results = self.primary_client.translate_many(
+                        texts, max_retries=max_retries, max_workers=max_workers
+                    )
+                else:
+                    results = [
+                        self.primary_client.translate_to_chinese(text, max_retries=max_retries)
+                        for text in texts
+                    ]
+            except Exception as e:
+                print(f"  Primary translator error: {e}, trying fallback...")
+
+        return self._fill_from_fallback(texts, results, max_retries)
+
+    def translate_batch(
+        self,
+        texts: List[str],
+        max_retries: int = 3,
+        max_chars_per_req: int = 30000,
+        max_workers: int = 4,
+    ) -> List[Optional[str]]:
+        """打包翻译内容（主服务按字符预算合并请求），失败的条目逐条切换到备用服务"""
+        if not self.primary_client or not hasattr(self.primary_client, "translate_batch"):
+            return self.translate_many(texts, max_retries=max_retries, max_workers=max_workers)
+
+        results: List[Optional[str]] = [None] * len(texts)
+        try:
+            results = self.primary_client.translate_batch(
+                texts,
+                max_retries=max_retries,
+                max_chars_per_req=max_chars_per_req,
+                max_workers=max_workers,
+            )
+        except Exception as e:
+            print(f"  Primary translator error: {e}, trying fallback...")
+
+        return self._fill_from_fallback(texts, results, max_retries)
+
+    def _fill_from_fallback(
+        self, texts: List[str], results: List[Optional[str]], max_retries: int
+    ) -> List[Optional[str]]:
+        """用备用服务逐条补齐主服务未翻译的条目"""
+        missing = [i for i, result in enumerate(results) if not result]
+        if missing and self.fallback_client:
+            print(f"  {len(missing)} item(s) not translated by primary, trying fallback...")
+            # Add delay before switching providers (to avoid rate limits)
+            print("  Waiting 2 seconds before trying fallback provider...")
+            time.sleep(2)
+            for i in missing:
+                try:
+                    result = self.fallback_client.translate_to_chinese(
+                        texts[i], max_retries=max_retries
+                    )
+                    if result:
+                        print("  ✓ Used fallback: Google Gemini")
+                        results[i] = result
+                except Exception as e:
+                    print(f"  Fallback translator error: {e}")
+
+        return results
@@ -3,11 +3,33 @@ RSS Monitor - Main orchestrator for multi-feed RSS to Notion sync
 """
 
 import sys
+from itertools import zip_longest
+from typing import List
+from urllib.parse import urlsplit
 from ..managers.config_manager import RSSConfig
-from ..managers.opml_parser import OPMLParser
+from ..managers.opml_parser import OPMLParser, RSSFeed
 from ..managers.rss_manager import RSSManager
 
 
+def _round_robin_by_host(feeds: List[RSSFeed]) -> List[RSSFeed]:
+    """
+    Interleave feeds so consecutive entries hit different hosts
+
+    Keeps OPML order within each host; a slow host then occupies one fetch
+    worker at a time instead of a whole run of them.
+    """
+    by_host = {}
+    for feed in feeds:
+        by_host.setdefault(urlsplit(feed.url).netloc.lower(), []).append(feed)
+
+    return [
+        feed
+        for round_ in zip_longest(*by_host.values())
+        for feed in round_
+        if feed is not None
+    ]
+
+
 class RSSMonitor:
     """Multi-feed RSS monitor"""
 
@@ -30,29 +52,33 @@ class RSSMonitor:
             print("No RSS feeds found. Please check your subscriptions.opml file.")
             sys.exit(1)
 
-        # Process each feed
-        for feed in feeds:
+        # Download all feeds up front, then process each result in order
+        feeds = _round_robin_by_host(feeds)
+        print(f"Fetching {len(feeds)} feeds...")
+        results = self.rss_manager.fetch_all(feeds)
+
+        for feed, parsed_feed in zip(feeds, results):
             print(f"\n{'=' * 50}")
             print(f"Feed: {feed.title}")
             print(f"URL: {feed.url}")
             print("=" * 50)
 
-            parsed_feed = self.rss_manager.fetch_feed(feed)
             if parsed_feed:
                 if isinstance(parsed_feed, dict) and parsed_feed.get("type") == "opml":
                     print(f"Processing nested OPML feeds...")
-                    nested_feeds = parsed_feed.get("feeds", [])
+                    nested_feeds = _round_robin_by_host(parsed_feed.get("feeds", []))
                     parent_title = parsed_feed.get("parent_title", feed.title)
                     parent_category = parsed_feed.get("parent_category", feed.category)
 
-                    for nested_feed in nested_feeds:
+                    nested_results = self.rss_manager.fetch_all(nested_feeds)
+
+                    for nested_feed, nested_parsed in zip(nested_feeds, nested_results):
                         print(f"\n  {'-' * 40}")
                         print(f"  Nested Feed: {nested_feed.title}")
                         print(f"  URL: {nested_feed.url}")
                         print(f"  Parent: {parent_title}")
                         print("  " + "-" * 40)
 
-                        nested_parsed = self.rss_manager.fetch_feed(nested_feed)
                         if nested_parsed:
                             print(f"  Entries: {len(nested_parsed.entries)}")
                             self.rss_manager.process_feed(
@@ -66,6 +92,10 @@ class RSSMonitor:
             else:
                 print(f"Failed to fetch feed: {feed.title}")
 
+        # Flush any cache entries still buffered by the coalescing save
+        self.rss_manager.cache_manager.save(force=True)
+        self.rss_manager.close()
+
         print("\n" + "=" * 50)
         print("Done!")
         print("=" * 50)
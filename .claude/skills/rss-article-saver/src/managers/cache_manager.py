@@ -5,26 +5,62 @@
 import os
 import json
 import time
+import atexit
+import pickle
 import hashlib
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时退回标准库 json
+    orjson = None
+
+
+def _dumps(data: Any) -> bytes:
+    """序列化为 UTF-8 编码的 JSON 字节串"""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """从 JSON 字节串反序列化"""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# 缓存文件中保存订阅源元数据的保留键（不是文章条目）
+_FEED_META_KEY = "_feed_meta"
 
 
 class ArticleCacheManager:
     """文章缓存管理器"""
 
-    def __init__(self, cache_file: str = "article_cache.json"):
+    def __init__(self, cache_file: str = "article_cache.json", flush_threshold: int = 100):
         """初始化缓存管理器"""
         self.cache_file = cache_file
         self.cache_data = self._load_cache()
+        # 每个订阅源的 HTTP 校验信息（ETag / Last-Modified），与文章条目分开存放
+        self.feed_meta: Dict[str, Dict[str, Any]] = self.cache_data.pop(_FEED_META_KEY, {})
+        # 已缓存文章链接集合，查重时直接做集合查找，无需逐条计算 MD5
+        self._link_set = {entry.get('link') for entry in self.cache_data.values()}
+        # 已解析订阅源条目的 pickle 缓存目录（与缓存文件同级）
+        self.parsed_dir = Path(cache_file).resolve().parent / "cache"
+
+        # 累计未落盘的新增条目，达到阈值才重写整个缓存文件
+        self._dirty_count = 0
+        self._flush_threshold = flush_threshold
+        atexit.register(self.save, force=True)
 
     def _load_cache(self) -> Dict[str, Any]:
         """加载缓存文件"""
         try:
             if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r', encoding='utf-8') as file:
-                    cache_data = json.load(file)
-                    print(f"成功加载缓存文件: {self.cache_file}")
-                    return cache_data
+                cache_data = _loads(Path(self.cache_file).read_bytes())
+                print(f"成功加载缓存文件: {self.cache_file}")
+                return cache_data
             else:
                 print(f"缓存文件不存在，将创建新的缓存: {self.cache_file}")
                 return {}
@@ -33,10 +69,14 @@ class ArticleCacheManager:
             return {}
 
     def _save_cache(self) -> None:
-        """保存缓存到文件"""
+        """保存缓存到文件（先写临时文件再原子替换）"""
+        tmp_file = f"{self.cache_file}.tmp"
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as file:
-                json.dump(self.cache_data, file, ensure_ascii=False, indent=2)
+            data = dict(self.cache_data)
+            data[_FEED_META_KEY] = self.feed_meta
+            Path(tmp_file).write_bytes(_dumps(data))
+            os.replace(tmp_file, self.cache_file)
+            self._dirty_count = 0
         except Exception as e:
             print(f"保存缓存文件失败: {e}")
 
@@ -46,8 +86,12 @@ class ArticleCacheManager:
 
     def is_article_cached(self, link: str) -> bool:
         """检查文章是否已被缓存"""
-        article_id = self._generate_article_id(link)
-        return article_id in self.cache_data
+        return link in self._link_set
+
+    def uncached_indices(self, links: List[str]) -> List[int]:
+        """批量查重：返回未缓存链接在列表中的下标（保持原顺序）"""
+        link_set = self._link_set
+        return [i for i, link in enumerate(links) if link not in link_set]
 
     def add_article_to_cache(self, article: 'Article') -> None:
         """将文章添加到缓存"""
@@ -59,6 +103,60 @@ class ArticleCacheManager:
             'published': article.published,
             'cached_time': time.time()
         }
+        self._link_set.add(article.link)
+        self._dirty_count += 1
+
+    def get_feed_meta(self, url: str) -> Dict[str, Any]:
+        """获取订阅源上次抓取时记录的 ETag / Last-Modified"""
+        return self.feed_meta.get(url, {})
+
+    def update_feed_meta(self, url: str, etag: str = None, last_modified: str = None) -> None:
+        """记录订阅源的 HTTP 校验信息，供下次条件请求使用"""
+        if not etag and not last_modified:
+            # 服务器不支持条件请求，清除旧记录
+            if self.feed_meta.pop(url, None) is not None:
+                self._dirty_count += 1
+            return
+        self.feed_meta[url] = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'parsed_at': time.time()
+        }
+        self._dirty_count += 1
+
+    def _parsed_feed_path(self, url: str) -> Path:
+        """订阅源解析结果的缓存文件路径"""
+        return self.parsed_dir / f"parsed_{hashlib.sha1(url.encode('utf-8')).hexdigest()}.pkl"
+
+    def load_parsed_feed(self, url: str, content_hash: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        读取订阅源的已解析条目
+
+        仅当缓存时的内容哈希与本次下载一致时命中，否则返回 None；
+        content_hash 为 None（服务器返回 304）时不校验哈希。
+        """
+        try:
+            with open(self._parsed_feed_path(url), 'rb') as f:
+                cached = pickle.load(f)
+            if content_hash is None or cached.get('hash') == content_hash:
+                return cached['entries']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"读取解析缓存失败: {e}")
+        return None
+
+    def save_parsed_feed(self, url: str, content_hash: str, entries: List[Dict[str, Any]]) -> None:
+        """以 pickle 保存订阅源的已解析条目（仅含纯字典）"""
+        path = self._parsed_feed_path(url)
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            self.parsed_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'hash': content_hash, 'entries': entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"保存解析缓存失败: {e}")
 
     def get_cache_stats(self):
         """获取缓存统计信息并清理过期缓存"""
@@ -70,7 +168,7 @@ class ArticleCacheManager:
             if current_time - entry_data.get('cached_time', 0) > 30 * 24 * 3600
         ]
         for entry_id in old_entries:
-            del self.cache_data[entry_id]
+            self._link_set.discard(self.cache_data.pop(entry_id).get('link'))
 
         if old_entries:
             print(f"已清理 {len(old_entries)} 个超过30天的旧缓存条目")
@@ -78,6 +176,14 @@ class ArticleCacheManager:
 
         return total_cached - len(old_entries), len(old_entries)
 
-    def save(self) -> None:
-        """保存缓存"""
+    def save(self, force: bool = False) -> None:
+        """
+        保存缓存
+
+        未落盘的新增条目少于阈值时跳过写入；force=True 时只要有改动就立即写入。
+        """
+        if not self._dirty_count:
+            return
+        if self._dirty_count < self._flush_threshold and not force:
+            return
         self._save_cache()
@@ -4,7 +4,7 @@ OPML Parser - Parse OPML files to extract RSS feed subscriptions
 
 import os
 import xml.etree.ElementTree as ET
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
 from dataclasses import dataclass
 
 
@@ -24,6 +24,25 @@ class OPMLParser:
 
     def __init__(self, opml_file: str = "subscriptions.opml"):
         self.opml_file = opml_file
+        self._content: Optional[Union[str, bytes]] = None
+
+    @classmethod
+    def from_string(
+        cls, xml_text: Union[str, bytes], source: str = "<string>"
+    ) -> "OPMLParser":
+        """
+        Create a parser for an in-memory OPML document
+
+        Args:
+            xml_text: OPML document as text or raw bytes
+            source: Name used in log messages (e.g. the URL it came from)
+
+        Returns:
+            OPMLParser that parses xml_text instead of reading a file
+        """
+        parser = cls(source)
+        parser._content = xml_text
+        return parser
 
     def parse(self) -> List[RSSFeed]:
         """
@@ -32,14 +51,16 @@ class OPMLParser:
         Returns:
             List of RSSFeed objects
         """
-        if not os.path.exists(self.opml_file):
+        if self._content is None and not os.path.exists(self.opml_file):
             raise FileNotFoundError(f"OPML file not found: {self.opml_file}")
 
         feeds = []
 
         try:
-            tree = ET.parse(self.opml_file)
-            root = tree.getroot()
+            if self._content is not None:
+                root = ET.fromstring(self._content)
+            else:
+                root = ET.parse(self.opml_file).getroot()
 
             # Find all outline elements with type="rss", type="post", etc.
             rss_outlines = root.findall(".//outline[@type='rss']")
@@ -3,16 +3,75 @@ RSS Manager - Main processing workflow for multiple RSS feeds
 """
 
 import feedparser
+import requests
 import os
+import re
+import html
+import hashlib
 import json
 import time
+import traceback
+from collections import deque
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import cached_property
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
+from typing import List, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ..core.models import Article
-from ..managers.opml_parser import RSSFeed
+from ..managers.opml_parser import OPMLParser, RSSFeed
 from ..managers.cache_manager import ArticleCacheManager
 from ..managers.content_manager import ContentExtractor
 from ..notion.notion_manager import BlogNotionManager
+from ..utils import fast_feedparser
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to requests' stdlib json
+    orjson = None
+
+# Project root: up from .claude/skills/rss-article-saver/src/managers/
+_PROJECT_ROOT = Path(__file__).resolve().parents[5]
+
+# Filename-unsafe characters: path separators become "-", the rest are dropped
+_TITLE_TRANS = str.maketrans(
+    {"/": "-", "\\": "-", ":": "", "?": "", "*": "", '"': "", "<": "", ">": "", "|": ""}
+)
+
+# Anything other than word characters, Chinese, space or "-" becomes "_"
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w\u4e00-\u9fff \-]")
+
+# Any opening or closing HTML tag; content without one skips BeautifulSoup
+# cleanup (a bare "<" or "a < b" in Markdown or text does not match)
+_HTML_TAG_RE = re.compile(r"</?[a-zA-Z][\w-]*[\s/>]")
+
+# Runs of 3+ newlines collapsed when cleaning saved Markdown
+_MULTI_NL = re.compile(r"\n{3,}")
+
+# Published times are shown in Shanghai time (UTC+8)
+_SHANGHAI_TZ = timezone(timedelta(hours=8))
+
+# Less common RSS date formats, tried only when the fast parsers fail
+_DATE_FORMATS = (
+    "%a, %d %b %Y %H:%M:%S %z",  # RFC 2822 with timezone
+    "%a, %d %b %Y %H:%M:%S %Z",  # RFC 2822 with UTC
+    "%a, %d %b %Y %H:%M:%S",     # RFC 2822 without timezone
+    "%Y-%m-%dT%H:%M:%S%z",       # ISO 8601
+    "%Y-%m-%dT%H:%M:%SZ",        # ISO 8601 UTC
+    "%Y-%m-%d %H:%M:%S",         # Simple format
+)
+
+# Character classes for is_mostly_english, scanned in C instead of per-char loops
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+_WS_RE = re.compile(r"\s")
+
+# Root tag of an OPML document, matched on raw response bytes
+_OPML_TAG_RE = re.compile(rb"<opml\b", re.IGNORECASE)
 
 
 def is_mostly_english(text: str, threshold: float = 0.3) -> bool:
@@ -29,11 +88,15 @@ def is_mostly_english(text: str, threshold: float = 0.3) -> bool:
     if not text or len(text.strip()) < 10:
         return True  # Treat very short text as English
 
+    # Pure ASCII cannot contain any Chinese characters
+    if text.isascii():
+        return True
+
     # Count Chinese characters (CJK Unified Ideographs)
-    chinese_chars = sum(1 for c in text if '\u4e00' <= c <= '\u9fff')
+    chinese_chars = len(_CJK_RE.findall(text))
 
     # Count total characters (excluding whitespace)
-    total_chars = sum(1 for c in text if not c.isspace())
+    total_chars = len(text) - len(_WS_RE.findall(text))
 
     if total_chars == 0:
         return True
@@ -42,9 +105,145 @@ def is_mostly_english(text: str, threshold: float = 0.3) -> bool:
     return chinese_ratio < threshold  # True if less than 30% Chinese chars
 
 
+def _parse_rss_date(published_str: str) -> Optional[datetime]:
+    """
+    Parse an RSS/Atom date string
+
+    RFC 2822 (most RSS) and ISO 8601 (Atom) go through the C-implemented
+    email.utils / datetime.fromisoformat parsers; the strptime formats are
+    only a last resort.
+
+    Returns:
+        Parsed datetime (naive when the string has no timezone), or None
+    """
+    if not published_str:
+        return None
+
+    try:
+        return parsedate_to_datetime(published_str)
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        return datetime.fromisoformat(published_str.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(published_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _clean_html_to_markdown(content: str) -> str:
+    """
+    Convert an article's HTML body to Markdown-like text for saving
+
+    Module-level and free of RSSManager state so it can run in a worker
+    process.
+
+    Args:
+        content: Article body (HTML, Markdown or plain text)
+
+    Returns:
+        Cleaned text; the entity-decoded input when it has no HTML tags
+    """
+    if not content:
+        return ""
+
+    content_to_save = content
+    try:
+        # Decode HTML entities first
+        content_to_save = html.unescape(content_to_save)
+
+        # Check if content contains real HTML tags (plain "<"/">" in
+        # Markdown or text is not enough to pay for a parse)
+        if _HTML_TAG_RE.search(content_to_save):
+            # Use BeautifulSoup to remove HTML tags but keep text
+            soup = BeautifulSoup(content_to_save, 'lxml')
+
+            # Convert to markdown-like format
+            # Convert headings
+            for tag in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+                level = int(tag.name[1])
+                prefix = "#" * level
+                tag.replace_with(f"\n\n{prefix} {tag.get_text()}\n\n")
+
+            # Convert paragraphs
+            for tag in soup.find_all('p'):
+                text = tag.get_text()
+                if text.strip():
+                    tag.replace_with(f"\n{text}\n")
+
+            # Convert images
+            for tag in soup.find_all('img'):
+                src = tag.get('src', '')
+                alt = tag.get('alt', '')
+                if src:
+                    tag.replace_with(f"\n\n![{alt}]({src})\n\n")
+                else:
+                    tag.decompose()
+
+            # Remove all other tags but keep text
+            for tag in soup.find_all(['div', 'span', 'section', 'article']):
+                tag.unwrap()
+
+            # Get final text
+            content_to_save = soup.get_text(separator='\n', strip=True)
+
+            # Clean up excessive newlines
+            content_to_save = _MULTI_NL.sub('\n\n', content_to_save)
+    except Exception as e:
+        print(f"    Warning: Failed to clean HTML: {e}")
+    return content_to_save
+
+
+def _normalize_feed_url(url: str) -> str:
+    """
+    Canonicalize a feed URL so equivalent spellings share one fetch
+
+    Lowercases scheme/host, drops the fragment and utm_* tracking params,
+    and rewrites GitHub blob URLs to their raw.githubusercontent.com form.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    path = parts.path
+
+    # Convert GitHub blob URLs to raw URLs
+    if netloc in ("github.com", "www.github.com") and "/blob/" in path:
+        netloc = "raw.githubusercontent.com"
+        path = path.replace("/blob/", "/", 1)
+
+    query = parts.query
+    if "utm_" in query.lower():
+        query = urlencode(
+            [
+                (key, value)
+                for key, value in parse_qsl(query, keep_blank_values=True)
+                if not key.lower().startswith("utm_")
+            ]
+        )
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
 class RSSManager:
     """Multi-feed RSS manager"""
 
+    # Directories already created in this process; mkdir only fires on a miss
+    _known_dirs: set = set()
+
+    # Concurrent page extractions per feed, and concurrent translator calls
+    # (kept low to respect provider rate limits)
+    _EXTRACT_WORKERS = 8
+    _TRANSLATE_WORKERS = 2
+
+    # Total body size (chars) of a feed batch above which HTML cleanup is
+    # spread over worker processes
+    _PROCESS_POOL_MIN_CHARS = 200_000
+
     def __init__(self, config):
         self.config = config
         self.cache_manager = ArticleCacheManager()
@@ -61,63 +260,107 @@ class RSSManager:
             self.notion_manager = None
             print("Notion sync disabled (notion.sync: false)")
 
+        # Notion pushes run in the background, one concurrent batch per feed
+        self._notion_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="notion")
+        self._notion_batch = []
+        self._notion_futures = []
+
+        # Markdown cleanup and file writes run off the main thread as well
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="rss-io")
+        self._io_futures = []
+
+        # Process pool for CPU-heavy HTML cleanup, created only when a batch needs it
+        self._cpu_pool = None
+
+        # One pooled session for feed and Reddit requests: reuses TCP/TLS
+        # connections across feeds on the same host and retries 5xx replies
+        self.http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]
+            ),
+        )
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
+        # Validators from this run's downloads; persisted once the feed is processed
+        self._pending_feed_meta = {}
+
         # Setup article directory (in project mymind, organized by week)
-        # Go up from .claude/skills/rss-article-saver/ to project root
-        project_root = Path(__file__).parent.parent.parent.parent.parent.parent
-        self.article_base_dir = project_root / "mymind" / "article"
-        self.article_base_dir.mkdir(parents=True, exist_ok=True)
+        self.article_base_dir = _PROJECT_ROOT / "mymind" / "article"
+        self._ensure_dir(self.article_base_dir)
         self.counter_file = self.article_base_dir / ".counter.json"
         self.article_counter, self.current_date = self._load_counter_state()
 
-        # Initialize AI client based on config
+        # AI client and translator SDKs are set up on first use (see the
+        # properties below), so runs with no new articles never load them
+        self._ai_cfg = config.get_ai_settings()
+        self._translation_cfg = config.get_translation_settings()
+        self.translation_enabled = self._translation_cfg.get("enabled", False)
+
+    @cached_property
+    def ai_client(self):
+        """AI client based on config, created on first access"""
         try:
-            ai_config = config.get_ai_settings()
-            if ai_config.get("enabled", True):
-                ai_provider = ai_config.get("provider", "deepseek").lower()
-                if ai_provider == "gemini" or ai_provider == "google":
-                    from ..ai.google_client import GeminiClient
-
-                    self.ai_client = GeminiClient()
-                    print(f"AI client initialized (Gemini)")
-                elif ai_provider == "zhipu" or ai_provider == "glm":
-                    from ..ai.zhipu_client import ZhipuClient
-
-                    self.ai_client = ZhipuClient()
-                    print(f"AI client initialized (Zhipu AI)")
-                else:
-                    from ..ai.deepseek_client import DeepSeekClient
+            if not self._ai_cfg.get("enabled", True):
+                return None
+
+            ai_provider = self._ai_cfg.get("provider", "deepseek").lower()
+            if ai_provider == "gemini" or ai_provider == "google":
+                from ..ai.google_client import GeminiClient
 
-                    self.ai_client = DeepSeekClient()
-                    print(f"AI client initialized (DeepSeek)")
+                client = GeminiClient()
+                print(f"AI client initialized (Gemini)")
+            elif ai_provider == "zhipu" or ai_provider == "glm":
+                from ..ai.zhipu_client import ZhipuClient
+
+                client = ZhipuClient()
+                print(f"AI client initialized (Zhipu AI)")
             else:
-                self.ai_client = None
+                from ..ai.deepseek_client import DeepSeekClient
+
+                client = DeepSeekClient()
+                print(f"AI client initialized (DeepSeek)")
+            return client
         except Exception as e:
             print(f"AI client init failed: {e}")
-            self.ai_client = None
+            return None
+
+    @cached_property
+    def translator(self):
+        """Translator based on config, created on first access"""
+        if not self.translation_enabled:
+            return None
 
-        # Initialize translator based on config
         try:
-            translation_config = config.get_translation_settings()
-            self.translation_enabled = translation_config.get("enabled", False)
-            if self.translation_enabled:
-                from ..ai.translation_client import FallbackTranslator
-
-                # Use fallback translator (NVIDIA -> Google Gemini)
-                primary = translation_config.get("provider", "nvidia").lower()
-                fallback = translation_config.get("fallback_provider", "google").lower()
-                self.translator = FallbackTranslator(
-                    primary_provider=primary,
-                    fallback_provider=fallback
-                )
-            else:
-                self.translator = None
+            from ..ai.translation_client import FallbackTranslator
+
+            # Use fallback translator (NVIDIA -> Google Gemini)
+            primary = self._translation_cfg.get("provider", "nvidia").lower()
+            fallback = self._translation_cfg.get("fallback_provider", "google").lower()
+            return FallbackTranslator(
+                primary_provider=primary,
+                fallback_provider=fallback
+            )
         except Exception as e:
-            import traceback
-
             print(f"Translator init failed: {e}")
             traceback.print_exc()
-            self.translator = None
             self.translation_enabled = False
+            return None
+
+    def close(self) -> None:
+        """Release the HTTP connection pool and background Notion/file workers"""
+        self._drain_notion_futures()
+        self._drain_io_futures()
+        self._notion_pool.shutdown(wait=True)
+        self._io_pool.shutdown(wait=True)
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=True)
+        self.http.close()
+        if self.notion_manager:
+            self.notion_manager.close()
 
     def _load_counter_state(self):
         """Load counter state from file for persistence across runs"""
@@ -127,7 +370,6 @@ class RSSManager:
 
             # Try to load from counter file first
             if self.counter_file.exists():
-                import json
                 with open(self.counter_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     saved_date = data.get('current_date')
@@ -172,7 +414,6 @@ class RSSManager:
     def _save_counter_state(self):
         """Save counter state to file for persistence across runs"""
         try:
-            import json
             with open(self.counter_file, 'w', encoding='utf-8') as f:
                 json.dump({
                     'article_counter': self.article_counter,
@@ -183,83 +424,132 @@ class RSSManager:
 
     def fetch_feed(self, feed: RSSFeed):
         """Fetch a single RSS feed"""
-        import requests
-        import tempfile
-        from ..managers.opml_parser import OPMLParser
+        url_to_fetch = _normalize_feed_url(feed.url)
+        if url_to_fetch != feed.url:
+            print(f"  Normalized URL: {url_to_fetch}")
+
+        return self._wrap_fetched(self._fetch_parsed(url_to_fetch), feed)
+
+    def fetch_all(self, feeds: List[RSSFeed], max_workers: int = 16) -> list:
+        """
+        Fetch several feeds concurrently
+
+        Downloads are network-bound, so a thread pool overlaps their latency;
+        processing the results stays sequential in the caller. Subscriptions
+        that normalize to the same URL are downloaded once and share the result.
+
+        Returns:
+            fetch_feed results in the same order as feeds
+        """
+        if not feeds:
+            return []
+
+        canonical_urls = []
+        for feed in feeds:
+            url_to_fetch = _normalize_feed_url(feed.url)
+            if url_to_fetch != feed.url:
+                print(f"  Normalized URL: {url_to_fetch}")
+            canonical_urls.append(url_to_fetch)
+        unique_urls = list(dict.fromkeys(canonical_urls))
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(unique_urls)), thread_name_prefix="fetch"
+        ) as pool:
+            fetched = dict(zip(unique_urls, pool.map(self._fetch_parsed, unique_urls)))
+
+        return [
+            self._wrap_fetched(fetched[url], feed)
+            for url, feed in zip(canonical_urls, feeds)
+        ]
+
+    @staticmethod
+    def _wrap_fetched(result, feed: RSSFeed):
+        """Nested OPML feeds: wrap with this subscription's title/category"""
+        if isinstance(result, list):
+            return {
+                "type": "opml",
+                "feeds": result,
+                "parent_title": feed.title,
+                "parent_category": feed.category,
+            }
+        return result
 
+    def _fetch_parsed(self, url_to_fetch: str):
+        """
+        Download and parse a canonical feed URL
+
+        Returns:
+            List of nested RSSFeed for OPML documents, parsed feed otherwise,
+            or None on failure
+        """
         try:
             # First, fetch the URL content to check if it's an OPML file
             print(f"  Fetching URL to check content type...")
 
-            # Convert GitHub blob URLs to raw URLs
-            url_to_fetch = feed.url
-            if "github.com" in url_to_fetch and "/blob/" in url_to_fetch:
-                url_to_fetch = url_to_fetch.replace(
-                    "github.com", "raw.githubusercontent.com"
-                ).replace("/blob/", "/")
-                print(f"  Converted GitHub blob URL to raw URL")
-
-            response = requests.get(url_to_fetch, timeout=10)
+            # Conditional GET: unchanged feeds come back as an empty 304
+            meta = self.cache_manager.get_feed_meta(url_to_fetch)
+            headers = {}
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+            response = self.http.get(url_to_fetch, headers=headers, timeout=10)
+            if response.status_code == 304:
+                # Unchanged since last run: reuse the entries parsed back then
+                entries = self.cache_manager.load_parsed_feed(url_to_fetch)
+                if entries is not None:
+                    return fast_feedparser.ParsedFeed(entries=entries)
+                # Nothing stored to reuse, download the full body instead
+                response = self.http.get(url_to_fetch, timeout=10)
             response.raise_for_status()
-            content = response.text
 
-            # Check if the content is OPML format (contains <opml> tag)
-            if "<opml" in content.lower():
+            # Check if the content is OPML format: the root tag sits in the
+            # first couple of KB, so only that prefix of the raw bytes is scanned
+            if _OPML_TAG_RE.search(response.content, 0, 2048):
                 print(f"  Detected OPML file, parsing nested feeds...")
-                # Save content to a temporary file
-                with tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".opml", delete=False
-                ) as tmp_file:
-                    tmp_file.write(content)
-                    tmp_file_path = tmp_file.name
-
-                try:
-                    # Parse the OPML file
-                    opml_parser = OPMLParser(tmp_file_path)
-                    nested_feeds = opml_parser.parse()
-
-                    if nested_feeds:
-                        print(f"  Found {len(nested_feeds)} nested RSS feeds in OPML")
-                        # Return special structure to indicate OPML type
-                        return {
-                            "type": "opml",
-                            "feeds": nested_feeds,
-                            "parent_title": feed.title,
-                            "parent_category": feed.category,
-                        }
-                    else:
-                        print(
-                            f"  Warning: OPML file contains no RSS feeds, falling back to RSS parser"
-                        )
-                finally:
-                    # Clean up temporary file
-                    try:
-                        import os
+                nested_feeds = OPMLParser.from_string(
+                    response.content, source=url_to_fetch
+                ).parse()
 
-                        os.unlink(tmp_file_path)
-                    except:
-                        pass
+                if nested_feeds:
+                    print(f"  Found {len(nested_feeds)} nested RSS feeds in OPML")
+                    return nested_feeds
+                else:
+                    print(
+                        f"  Warning: OPML file contains no RSS feeds, falling back to RSS parser"
+                    )
+
+            self._pending_feed_meta[url_to_fetch] = (
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+
+            # Same bytes as last time: reuse the pickled entries, skip parsing
+            content_hash = hashlib.sha1(response.content).hexdigest()
+            entries = self.cache_manager.load_parsed_feed(url_to_fetch, content_hash)
+            if entries is not None:
+                return fast_feedparser.ParsedFeed(entries=entries)
 
-            # If not OPML, parse as regular RSS feed
-            parsed = feedparser.parse(url_to_fetch)
+            # If not OPML, parse the already-downloaded body as a regular feed
+            parsed = fast_feedparser.parse_bytes(response.content)
 
             if parsed.bozo:
                 print(f"  Feed parse warning: {parsed.bozo_exception}")
 
-            return parsed
+            entries = fast_feedparser.to_plain_entries(parsed.entries)
+            if entries:
+                self.cache_manager.save_parsed_feed(url_to_fetch, content_hash, entries)
+            return fast_feedparser.ParsedFeed(
+                entries=entries,
+                bozo=bool(parsed.bozo),
+                bozo_exception=getattr(parsed, "bozo_exception", None),
+            )
 
         except requests.RequestException as e:
             print(f"  Warning: Could not check if URL is OPML: {e}")
             # Fall through to feedparser
             try:
-                # Convert GitHub blob URLs to raw URLs
-                url_to_fetch = feed.url
-                if "github.com" in url_to_fetch and "/blob/" in url_to_fetch:
-                    url_to_fetch = url_to_fetch.replace(
-                        "github.com", "raw.githubusercontent.com"
-                    ).replace("/blob/", "/")
-                    print(f"  Converted GitHub blob URL to raw URL (fallback)")
-
                 parsed = feedparser.parse(url_to_fetch)
                 if parsed.bozo:
                     print(f"  Feed parse warning: {parsed.bozo_exception}")
@@ -270,8 +560,6 @@ class RSSManager:
 
         except Exception as e:
             print(f"  Failed to fetch feed: {e}")
-            import traceback
-
             traceback.print_exc()
             return None
 
@@ -279,21 +567,27 @@ class RSSManager:
         self, parsed_feed, feed_info: RSSFeed, parent_category: str = None
     ) -> None:
         """Process feed entries"""
+        # The previous feed's Notion batch has overlapped with this feed's
+        # download; collect it now so at most one batch is in flight
+        self._drain_notion_futures()
+
         max_articles = self.config.get_max_articles_per_feed()
         max_age_days = self.config.get_max_article_age_days()
 
         # First, filter out cached articles, then limit
         new_articles = []
 
-        for entry in parsed_feed.entries:
+        # Dedup the whole feed in one pass over its links, so Article objects
+        # are only built for entries that are actually new
+        entries = parsed_feed.entries
+        links = [entry.get("link", "") for entry in entries]
+
+        for i in self.cache_manager.uncached_indices(links):
             # Stop if we've reached the max limit
             if len(new_articles) >= max_articles:
                 break
 
-            link = entry.get("link", "")
-
-            if self.cache_manager.is_article_cached(link):
-                continue
+            entry = entries[i]
 
             # Filter by article age if configured
             if max_age_days > 0:
@@ -308,11 +602,49 @@ class RSSManager:
 
         print(f"  New articles: {len(new_articles)}")
 
-        for article in new_articles:
-            self._process_article(article)
+        # Page fetches are independent and network-bound: extract them concurrently
+        if new_articles:
+            with ThreadPoolExecutor(
+                max_workers=min(self._EXTRACT_WORKERS, len(new_articles)),
+                thread_name_prefix="extract",
+            ) as pool:
+                list(pool.map(self._extract_article, new_articles))
+
+        # Translate the whole batch at once to amortize per-request overhead
+        if new_articles and self.translation_enabled and self.translator:
+            self._translate_articles(new_articles)
+
+        # Convert HTML bodies for the Markdown files (full_content itself is kept
+        # as-is for the Notion push)
+        cleaned_contents = self._clean_contents(new_articles)
+
+        for article, content_to_save in zip(new_articles, cleaned_contents):
+            self._process_article(article, content_to_save)
+
+        # Push the feed's articles to Notion as one concurrent batch; it keeps
+        # running while the next feed is processed (drained there or in close)
+        if self._notion_batch:
+            self._notion_futures.append(
+                self._notion_pool.submit(
+                    self.notion_manager.push_articles_to_notion, self._notion_batch
+                )
+            )
+            self._notion_batch = []
+
+        # Wait for background file writes of this feed to finish
+        self._drain_io_futures()
+
+        # Only remember the validators once the feed's articles are handled,
+        # so a 304 on the next run always has a matching stored parse
+        feed_url = _normalize_feed_url(feed_info.url)
+        if feed_url in self._pending_feed_meta:
+            etag, last_modified = self._pending_feed_meta.pop(feed_url)
+            self.cache_manager.update_feed_meta(feed_url, etag, last_modified)
 
-        # Save cache
-        self.cache_manager.save()
+        # Flush the cache once per feed that saved articles, so a run killed
+        # before exit (atexit never runs on SIGKILL) cannot save them again;
+        # validator-only changes stay coalesced
+        self.cache_manager.save(force=bool(new_articles))
 
     def _create_article_from_entry(
         self, entry, feed_info: RSSFeed, parent_category: str = None
@@ -349,8 +681,8 @@ class RSSManager:
             feed_url=feed_info.url,  # Store RSS feed URL
         )
 
-    def _process_article(self, article: Article) -> None:
-        """Process single article: extract content, translate, sync to Notion, save to local"""
+    def _extract_article(self, article: Article) -> None:
+        """Extract full content, images and Reddit comments for an article"""
         print(f"\n  Processing: {article.title[:50]}...")
 
         # Extract full content from page (always extract to ensure clean content)
@@ -374,69 +706,143 @@ class RSSManager:
             print("    Extracting Reddit comments...")
             article.comments = self._extract_reddit_comments(article.link)
 
-        # Translate content to Chinese if enabled
-        if self.translation_enabled and self.translator and article.full_content:
-            print("    Translating to Chinese...")
-            try:
-                # Translate title
-                if hasattr(self.translator, 'translate_title'):
-                    translated_title = self.translator.translate_title(article.title)
+    def _translate_articles(self, articles: List[Article]) -> None:
+        """Translate titles and contents of a batch of articles to Chinese"""
+        to_translate = [article for article in articles if article.full_content]
+        if not to_translate:
+            return
+
+        print(f"\n  Translating {len(to_translate)} article(s) to Chinese...")
+        try:
+            # Translate titles
+            if hasattr(self.translator, 'translate_title'):
+                with ThreadPoolExecutor(
+                    max_workers=self._TRANSLATE_WORKERS, thread_name_prefix="translate"
+                ) as pool:
+                    titles = list(pool.map(
+                        self.translator.translate_title,
+                        [article.title for article in to_translate]
+                    ))
+                for article, translated_title in zip(to_translate, titles):
                     if translated_title:
                         article.translated_title = translated_title
                         print(f"    Title translated: {translated_title}")
 
-                # Translate content with retry and detection
-                translation_success = False
-                max_attempts = 2
-
-                for attempt in range(max_attempts):
-                    translated_content = self.translator.translate_to_chinese(
-                        article.full_content,
-                        max_retries=3
-                    )
+            # Translate contents packed into as few requests as the size budget
+            # allows, retrying the ones that came back empty or still mostly English
+            pending = to_translate
+            max_attempts = 2
+
+            for attempt in range(max_attempts):
+                translations = self.translator.translate_batch(
+                    [article.full_content for article in pending],
+                    max_retries=3,
+                    max_chars_per_req=30000,
+                    max_workers=self._TRANSLATE_WORKERS
+                )
 
-                    if translated_content:
-                        # Check if translation actually worked (content is no longer mostly English)
-                        if not is_mostly_english(translated_content):
-                            article.full_content = translated_content
-                            print("    Content translation completed")
-                            translation_success = True
-                            break
-                        else:
-                            print(f"    Warning: Translation result still mostly English (attempt {attempt + 1}/{max_attempts})")
-                            if attempt < max_attempts - 1:
-                                print("    Waiting 3 seconds before retry...")
-                                time.sleep(3)
+                failed = []
+                for article, translated_content in zip(pending, translations):
+                    if translated_content and not is_mostly_english(translated_content):
+                        article.full_content = translated_content
                     else:
-                        print(f"    Warning: Translation returned None (attempt {attempt + 1}/{max_attempts})")
-                        if attempt < max_attempts - 1:
-                            print("    Waiting 3 seconds before retry...")
-                            time.sleep(3)
+                        failed.append(article)
 
-                if not translation_success:
-                    print("    Warning: Translation failed after all attempts, using original content")
+                print(f"    Content translation completed: {len(pending) - len(failed)}/{len(pending)}")
+                pending = failed
+                if not pending:
+                    break
+
+                print(f"    Warning: {len(pending)} translation(s) empty or still mostly English (attempt {attempt + 1}/{max_attempts})")
+                if attempt < max_attempts - 1:
+                    print("    Waiting 3 seconds before retry...")
+                    time.sleep(3)
 
-                # Add delay between articles to avoid rate limits
-                time.sleep(2)
+            for article in pending:
+                print(f"    Warning: Translation failed after all attempts, using original content: {article.title[:50]}")
 
-            except Exception as e:
-                print(f"    Warning: Translation error: {e}, using original content")
+            # Add delay between batches to avoid rate limits
+            time.sleep(2)
+
+        except Exception as e:
+            print(f"    Warning: Translation error: {e}, using original content")
 
-        # Sync to Notion
+    def _process_article(self, article: Article, content_to_save: str) -> None:
+        """Finish a prepared article: sync to Notion, cache, save cleaned content to local"""
+        # Sync to Notion (queued; the feed's batch is pushed in the background)
         if self.notion_sync_enabled and self.notion_manager and self.notion_manager.enabled:
-            print("    Syncing to Notion...")
-            self.notion_manager.push_article_to_notion(article)
+            print(f"    Syncing to Notion: {article.title[:50]}...")
+            self._notion_batch.append(article)
         else:
             print("    Skipping Notion sync (disabled in config)")
 
         # Add to cache
         self.cache_manager.add_article_to_cache(article)
 
-        # Save article to file
-        self._save_article(article)
+        # Save article to file: numbered here in order, written in the background
+        filepath = self._reserve_article_path(article)
+        if filepath:
+            self._io_futures.append(
+                self._io_pool.submit(self._save_article, article, filepath, content_to_save)
+            )
+
+    def _clean_contents(self, articles: List[Article]) -> List[str]:
+        """
+        Clean article bodies to Markdown, in worker processes for large batches
 
-    def _save_article(self, article: Article) -> None:
-        """Save article to mymind/article directory organized by week as Markdown"""
+        BeautifulSoup parsing is CPU-bound and holds the GIL, so big batches go
+        to a process pool (started on first need); small ones are not worth
+        the inter-process copying and run inline.
+        """
+        contents = [article.full_content or "" for article in articles]
+        if len(contents) < 2 or sum(map(len, contents)) < self._PROCESS_POOL_MIN_CHARS:
+            return [_clean_html_to_markdown(content) for content in contents]
+
+        try:
+            if self._cpu_pool is None:
+                self._cpu_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return list(self._cpu_pool.map(_clean_html_to_markdown, contents))
+        except Exception as e:
+            print(f"    Warning: Parallel HTML cleanup failed ({e}), cleaning inline")
+            return [_clean_html_to_markdown(content) for content in contents]
+
+    def _drain_notion_futures(self) -> None:
+        """Wait for pending Notion pushes and report failures"""
+        if not self._notion_futures:
+            return
+        wait(self._notion_futures)
+        for future in self._notion_futures:
+            error = future.exception()
+            if error:
+                print(f"    Warning: Notion sync error: {error}")
+        self._notion_futures = []
+
+    def _drain_io_futures(self) -> None:
+        """Wait for pending article file writes (they report their own errors)"""
+        if self._io_futures:
+            wait(self._io_futures)
+            self._io_futures = []
+
+    @staticmethod
+    def _ensure_dir(path: Path) -> None:
+        """Create a directory (and parents) unless already created this process"""
+        if path not in RSSManager._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            RSSManager._known_dirs.add(path)
+
+    def _reserve_article_path(self, article: Article) -> Optional[Path]:
+        """
+        Number an article and work out where it will be saved
+
+        Runs on the calling thread so the per-day counter stays sequential;
+        the directory is created and the counter state persisted here.
+
+        Returns:
+            Path of the Markdown file to write, or None on failure
+        """
         try:
             # Get current date
             now = datetime.now()
@@ -454,21 +860,9 @@ class RSSManager:
             title_for_filename = (article.translated_title or article.title)[:100]
 
             # Create safe filename (keep Chinese characters)
-            safe_title = title_for_filename.replace("/", "-").replace("\\", "-")
-            safe_title = safe_title.replace(":", "").replace("?", "").replace("*", "")
-            safe_title = (
-                safe_title.replace('"', "")
-                .replace("<", "")
-                .replace(">", "")
-                .replace("|", "")
-            )
+            safe_title = title_for_filename.translate(_TITLE_TRANS)
             # Only replace special characters, keep alphanumeric and Chinese
-            safe_title = "".join(
-                c
-                if c.isalnum() or c > "\u4e00" and c < "\u9fff" or c in (" ", "-", "_")
-                else "_"
-                for c in safe_title
-            )
+            safe_title = _UNSAFE_FILENAME_RE.sub("_", safe_title)
 
             # Use title as filename with number prefix
             filename = f"{self.article_counter}_{safe_title}.md"
@@ -484,12 +878,24 @@ class RSSManager:
             else:
                 save_base_dir = self.article_base_dir
 
-            save_base_dir.mkdir(parents=True, exist_ok=True)
             date_dir = save_base_dir / date_dir_name
-            date_dir.mkdir(exist_ok=True)
+            self._ensure_dir(date_dir)
 
-            filepath = date_dir / filename
+            # Save counter state for persistence across runs
+            self._save_counter_state()
+
+            return date_dir / filename
+        except Exception as e:
+            print(f"    Warning: Failed to save article: {e}")
+            return None
 
+    def _save_article(self, article: Article, filepath: Path, content_to_save: str) -> None:
+        """
+        Save article as Markdown to the path reserved in the mymind/article directory
+
+        content_to_save is the article body already cleaned by _clean_html_to_markdown.
+        """
+        try:
             # Build Markdown content
             md_content = []
 
@@ -513,55 +919,6 @@ class RSSManager:
 
             # Original Content (images are embedded in content)
             md_content.append("## 正文\n")
-            # Clean and decode content
-            content_to_save = article.full_content or ""
-            if content_to_save:
-                try:
-                    import html
-                    from bs4 import BeautifulSoup
-
-                    # Decode HTML entities first
-                    content_to_save = html.unescape(content_to_save)
-
-                    # Check if content contains HTML tags
-                    if "<" in content_to_save and ">" in content_to_save:
-                        # Use BeautifulSoup to remove HTML tags but keep text
-                        soup = BeautifulSoup(content_to_save, 'html.parser')
-
-                        # Convert to markdown-like format
-                        # Convert headings
-                        for tag in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                            level = int(tag.name[1])
-                            prefix = "#" * level
-                            tag.replace_with(f"\n\n{prefix} {tag.get_text()}\n\n")
-
-                        # Convert paragraphs
-                        for tag in soup.find_all('p'):
-                            text = tag.get_text()
-                            if text.strip():
-                                tag.replace_with(f"\n{text}\n")
-
-                        # Convert images
-                        for tag in soup.find_all('img'):
-                            src = tag.get('src', '')
-                            alt = tag.get('alt', '')
-                            if src:
-                                tag.replace_with(f"\n\n![{alt}]({src})\n\n")
-                            else:
-                                tag.decompose()
-
-                        # Remove all other tags but keep text
-                        for tag in soup.find_all(['div', 'span', 'section', 'article']):
-                            tag.unwrap()
-
-                        # Get final text
-                        content_to_save = soup.get_text(separator='\n', strip=True)
-
-                        # Clean up excessive newlines
-                        import re
-                        content_to_save = re.sub(r'\n{3,}', '\n\n', content_to_save)
-                except Exception as e:
-                    print(f"    Warning: Failed to clean HTML: {e}")
             md_content.append(f"{content_to_save}\n")
 
             # Comments section (if available)
@@ -569,12 +926,12 @@ class RSSManager:
                 md_content.append("\n## 评论\n")
                 md_content.append(f"{article.comments}\n")
 
-            # Save to file
-            with open(filepath, "w", encoding="utf-8") as f:
+            # Save to file: write a temp file in the same directory, then swap it
+            # in atomically so an interrupted save never leaves a partial .md
+            tmp_path = filepath.with_suffix(".md.tmp")
+            with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
                 f.write("\n".join(md_content))
-
-            # Save counter state for persistence across runs
-            self._save_counter_state()
+            os.replace(tmp_path, filepath)
 
             print(f"    Saved to: {filepath}")
         except Exception as e:
@@ -583,25 +940,7 @@ class RSSManager:
     def _is_article_within_days(self, published_str: str, days: int) -> bool:
         """Check if article was published within the specified number of days"""
         try:
-            from datetime import datetime, timezone, timedelta
-
-            # Try to parse common RSS date formats
-            formats = [
-                "%a, %d %b %Y %H:%M:%S %z",  # RFC 2822 with timezone
-                "%a, %d %b %Y %H:%M:%S %Z",  # RFC 2822 with UTC
-                "%a, %d %b %Y %H:%M:%S",     # RFC 2822 without timezone
-                "%Y-%m-%dT%H:%M:%S%z",       # ISO 8601
-                "%Y-%m-%dT%H:%M:%SZ",        # ISO 8601 UTC
-                "%Y-%m-%d %H:%M:%S",         # Simple format
-            ]
-
-            parsed_time = None
-            for fmt in formats:
-                try:
-                    parsed_time = datetime.strptime(published_str, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed_time = _parse_rss_date(published_str)
 
             if parsed_time is None:
                 # If parsing fails, assume article is recent (don't filter)
@@ -628,41 +967,21 @@ class RSSManager:
     def _format_published_time(self, published_str: str) -> str:
         """Format published time to Shanghai timezone (UTC+8)"""
         try:
-            from datetime import datetime, timezone, timedelta
-
-            # Try to parse common RSS date formats
             # Format: "Wed, 28 Jan 2026 13:55:00 +0000"
-            formats = [
-                "%a, %d %b %Y %H:%M:%S %z",  # RFC 2822 with timezone
-                "%a, %d %b %Y %H:%M:%S %Z",  # RFC 2822 with UTC
-                "%a, %d %b %Y %H:%M:%S",     # RFC 2822 without timezone
-                "%Y-%m-%dT%H:%M:%S%z",       # ISO 8601
-                "%Y-%m-%dT%H:%M:%SZ",        # ISO 8601 UTC
-                "%Y-%m-%d %H:%M:%S",         # Simple format
-            ]
-
-            parsed_time = None
-            for fmt in formats:
-                try:
-                    parsed_time = datetime.strptime(published_str, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed_time = _parse_rss_date(published_str)
 
             if parsed_time is None:
                 # If parsing fails, return original string
                 return published_str
 
             # Convert to Shanghai timezone (UTC+8)
-            shanghai_tz = timezone(timedelta(hours=8))
-
             # If parsed time has timezone info, convert it
             if parsed_time.tzinfo is not None:
-                parsed_time = parsed_time.astimezone(shanghai_tz)
+                parsed_time = parsed_time.astimezone(_SHANGHAI_TZ)
             else:
                 # If no timezone, assume UTC
                 parsed_time = parsed_time.replace(tzinfo=timezone.utc).astimezone(
-                    shanghai_tz
+                    _SHANGHAI_TZ
                 )
 
             # Format as "2026-01-29 08:18:47"
@@ -675,8 +994,6 @@ class RSSManager:
     def _extract_reddit_comments(self, reddit_url: str) -> str:
         """Extract comments from Reddit post using JSON API"""
         try:
-            import requests
-
             # Convert to old.reddit.com for better compatibility
             old_url = reddit_url.replace("www.reddit.com", "old.reddit.com")
             json_url = old_url if old_url.endswith(".json") else f"{old_url}.json"
@@ -685,10 +1002,10 @@ class RSSManager:
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             }
 
-            response = requests.get(json_url, timeout=30, headers=headers)
+            response = self.http.get(json_url, timeout=30, headers=headers)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content) if orjson else response.json()
 
             # Reddit JSON returns a list: [post_data, comments_data]
             if not isinstance(data, list) or len(data) < 2:
@@ -697,42 +1014,37 @@ class RSSManager:
             comments_data = data[1]
             comments = []
 
-            # Extract comments from the JSON structure
-            def extract_comment_text(comment_data):
-                """Recursively extract comment text"""
-                if not isinstance(comment_data, dict):
-                    return None
-
-                # Get the comment data
-                comment = comment_data.get("data", {})
-
-                # Extract the comment body
-                body = comment.get("body", "")
-                if body and body != "[deleted]" and body != "[removed]":
-                    # Get author if available
-                    author = comment.get("author", "Unknown")
-                    # Get score if available
-                    score = comment.get("score", 0)
-                    return f"{body} (by {author}, +{score})"
-
-                # Check for replies
-                children = comment_data.get("replies", {})
-                if isinstance(children, dict) and "data" in children:
-                    children_data = children["data"].get("children", [])
-                    for child in children_data[:3]:  # Limit to top 3 replies per comment
-                        text = extract_comment_text(child)
-                        if text:
-                            comments.append(text)
-
-                return None
-
-            # Process top-level comments
             if "data" in comments_data:
+                # Walk the comment tree iteratively: top 20 comments; a deleted or
+                # removed comment is replaced by up to 3 of its replies, at most
+                # 3 levels deep and 200 comments in total
                 children = comments_data["data"].get("children", [])
-                for child in children[:20]:  # Limit to top 20 comments
-                    text = extract_comment_text(child)
-                    if text:
-                        comments.append(text)
+                pending = deque((child, 0) for child in children[:20])
+
+                while pending and len(comments) < 200:
+                    node, depth = pending.popleft()
+                    if not isinstance(node, dict):
+                        continue
+
+                    # Get the comment data
+                    comment = node.get("data", {})
+
+                    # Extract the comment body
+                    body = comment.get("body", "")
+                    if body and body != "[deleted]" and body != "[removed]":
+                        # Get author and score if available
+                        author = comment.get("author", "Unknown")
+                        score = comment.get("score", 0)
+                        comments.append(f"{body} (by {author}, +{score})")
+                        continue
+
+                    # Check for replies, visited before the next sibling
+                    replies = node.get("replies", {})
+                    if depth < 3 and isinstance(replies, dict) and "data" in replies:
+                        replies_data = replies["data"].get("children", [])
+                        pending.extendleft(
+                            (child, depth + 1) for child in reversed(replies_data[:3])
+                        )
 
             if comments:
                 return "\n\n".join([f"- {c}" for c in comments])
@@ -3,11 +3,163 @@ Notion Manager - Blog articles sync to existing database
 """
 
 import os
+import re
+import json
+import random
+import hashlib
+import sqlite3
 import requests
-import mimetypes
-import tempfile
-from notion_client import Client
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Optional
+from urllib.parse import parse_qs, unquote_plus, urlparse
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
+NOTION_API_URL = "https://api.notion.com/v1"
+NOTION_VERSION = "2022-06-28"
+
+
+class _RateLimiter:
+    """Thread-safe limiter that spaces calls evenly at `rate` per second"""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the caller's slot comes up"""
+        with self._lock:
+            slot = max(self._next_slot, time.monotonic())
+            self._next_slot = slot + self._interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Notion allows about 3 requests per second per integration token; every
+# worker thread goes through this shared limiter
+_NOTION_LIMITER = _RateLimiter(3)
+
+
+def _dumps(data) -> bytes:
+    """Serialize a request payload to UTF-8 JSON bytes"""
+    if orjson:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+# Notion responses worth retrying (rate limit and transient server errors)
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+# Retrieved database schemas: database_id -> (fetched at, properties)
+_SCHEMA_CACHE: dict = {}
+_SCHEMA_TTL = 300
+
+# Page properties set by _build_page_payload
+_PAGE_PROPERTIES = ("Title", "Link", "Author", "type", "Status")
+
+# Links already pushed to Notion: link -> page id, shared across runs
+_PUSHED_DB_PATH = os.path.expanduser("~/.cache/rss_notion.sqlite")
+
+# Notion accepts at most this many child blocks per create/append request
+_MAX_CHILDREN = 100
+
+# Notion rejects rich text items over 2000 characters; long text is split
+_TEXT_CHUNK = 1900
+
+
+def _block(block_type: str, rich_text: list) -> dict:
+    """Notion block of a rich-text type (heading_N, list item, paragraph)"""
+    return {"type": block_type, block_type: {"rich_text": rich_text}}
+
+
+def _para(rich_text: list) -> dict:
+    """Notion paragraph block"""
+    return {"type": "paragraph", "paragraph": {"rich_text": rich_text}}
+
+
+def _text_parts(content: str, bold: bool = False):
+    """
+    Yield rich text items for content, split into chunks that stay under
+    Notion's 2000-character limit per text object
+    """
+    for j in range(0, len(content) or 1, _TEXT_CHUNK):
+        part = {"type": "text", "text": {"content": content[j : j + _TEXT_CHUNK]}}
+        if bold:
+            part["annotations"] = {"bold": True}
+        yield part
+
+
+# Blocks are only serialized, never mutated, so constant blocks can be shared
+_DIVIDER = {"type": "divider", "divider": {}}
+
+# Divider and heading placed before a page's image section
+_IMAGE_SECTION_PRELUDE = (
+    _DIVIDER,
+    _block("heading_2", [{"type": "text", "text": {"content": "文章图片"}}]),
+)
+
+# Markdown line prefixes -> Notion block type, most specific first. Headings
+# keep their text verbatim; list items get inline formatting
+_PREFIX_TABLE = (
+    ("### ", 4, "heading_3"),
+    ("## ", 3, "heading_2"),
+    ("# ", 2, "heading_1"),
+    ("- ", 2, "bulleted_list_item"),
+    ("* ", 2, "bulleted_list_item"),
+)
+_PREFIX_CHARS = frozenset("#-*")
+
+# Ordered list marker ("1. "); match() anchors it at the line start
+_ORDERED_RE = re.compile(r"\d+\.\s")
+
+# Inline **bold** span (non-greedy, so adjacent spans stay separate)
+_BOLD_RE = re.compile(r"\*\*(.*?)\*\*", re.S)
+
+
+def _idempotency_key(link: str) -> str:
+    """Deterministic per-article key, so a retried page create is recognisable"""
+    return hashlib.sha256(link.encode("utf-8")).hexdigest()[:32]
+
+
+@lru_cache(maxsize=1024)
+def _parse_image_url(url: str) -> str:
+    """Parse real image URL from Next.js proxy URLs"""
+    # Only Next.js image proxy URLs need parsing
+    if "/_next/image" not in url:
+        return url
+    try:
+        query = parse_qs(urlparse(url).query)
+        # Get the real URL from the 'url' parameter
+        real_url = query.get("url", [url])[0]
+        return unquote_plus(real_url)
+    except Exception:
+        return url
+
+
+def _pooled_session() -> requests.Session:
+    """requests Session with connection pooling and retries on connection errors"""
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            # Only connection-level failures are retried here; 429/5xx
+            # replies reach _retry, which owns the backoff and Retry-After
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        ),
+    )
+    return session
 
 
 class BlogNotionManager:
@@ -17,25 +169,107 @@ class BlogNotionManager:
         self.database_id = os.getenv("NOTION_DATABASE_ID")
         notion_key = os.getenv("notion_key")
 
+        self._http = None
+        # Property names the database schema defines (None: not known)
+        self._allowed_props = None
+        self._seen = None
+        self._seen_lock = threading.Lock()
+
         if not notion_key or not self.database_id:
             print("Notion credentials not found, sync disabled")
-            self.client = None
             self.enabled = False
             return
 
+        # Pooled session for direct REST calls to the Notion API
+        self._http = _pooled_session()
+        self._http.headers.update(
+            {"Authorization": f"Bearer {notion_key}", "Notion-Version": NOTION_VERSION}
+        )
+
         try:
-            self.client = Client(auth=notion_key)
             self.enabled = True
             self._verify_database()
+            self._open_pushed_db()
         except Exception as e:
             print(f"Notion init failed: {e}")
             self.enabled = False
 
+    def close(self) -> None:
+        """Close pooled HTTP connections and the pushed-link cache"""
+        if self._http is not None:
+            self._http.close()
+        if self._seen is not None:
+            with self._seen_lock:
+                self._seen.close()
+                self._seen = None
+
+    def _open_pushed_db(self) -> None:
+        """Open the sqlite cache of already-pushed links (disabled if unavailable)"""
+        try:
+            os.makedirs(os.path.dirname(_PUSHED_DB_PATH), exist_ok=True)
+            # Shared by the push worker threads; access goes through _seen_lock
+            self._seen = sqlite3.connect(_PUSHED_DB_PATH, check_same_thread=False)
+            self._seen.execute(
+                "CREATE TABLE IF NOT EXISTS pushed(link TEXT PRIMARY KEY, page_id TEXT, ts REAL)"
+            )
+            self._seen.commit()
+        except sqlite3.Error as e:
+            print(f"Pushed-link cache unavailable: {e}")
+            self._seen = None
+
+    def _is_pushed(self, link: str) -> bool:
+        """Whether the link was already pushed to Notion"""
+        if self._seen is None:
+            return False
+        with self._seen_lock:
+            row = self._seen.execute(
+                "SELECT 1 FROM pushed WHERE link = ?", (link,)
+            ).fetchone()
+        return row is not None
+
+    def _mark_pushed(self, link: str, page_id: str) -> None:
+        """Record a successfully created page"""
+        if self._seen is None:
+            return
+        try:
+            with self._seen_lock:
+                self._seen.execute(
+                    "INSERT OR REPLACE INTO pushed VALUES (?, ?, ?)", (link, page_id, time.time())
+                )
+                self._seen.commit()
+        except sqlite3.Error as e:
+            # The page exists either way; only the skip on the next run is lost
+            print(f"    Could not record pushed link: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _notion_request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Rate-limited request to the Notion REST API"""
+        _NOTION_LIMITER.wait()
+        return self._http.request(method, f"{NOTION_API_URL}{path}", timeout=30, **kwargs)
+
     def _verify_database(self) -> bool:
-        """Verify database exists"""
+        """Verify database exists and load its property schema (cached per process)"""
+        cached = _SCHEMA_CACHE.get(self.database_id)
+        if cached and time.monotonic() - cached[0] < _SCHEMA_TTL:
+            self._allowed_props = set(cached[1])
+            return True
+
         try:
-            response = self.client.databases.retrieve(database_id=self.database_id)
+            resp = self._retry(self._notion_request, "GET", f"/databases/{self.database_id}")
+            resp.raise_for_status()
+            response = resp.json()
             print(f"Connected to Notion database")
+            properties = response.get("properties", {})
+            _SCHEMA_CACHE[self.database_id] = (time.monotonic(), properties)
+            self._allowed_props = set(properties)
+            missing = [name for name in _PAGE_PROPERTIES if name not in properties]
+            if missing:
+                print(f"Database schema lacks properties {', '.join(missing)}; they will be skipped")
             return True
         except Exception as e:
             print(f"Database verification failed: {e}")
@@ -47,44 +281,25 @@ class BlogNotionManager:
         if not self.enabled:
             return False
 
+        if self._is_pushed(article.link):
+            print(f"  Already in Notion, skipped")
+            return True
+
         try:
-            # Debug: Check article content
-            if article.full_content:
-                print(f"    Article content length: {len(article.full_content)} chars")
-                print(f"    Article content preview: {article.full_content[:100]}...")
-            else:
+            if not article.full_content:
                 print(f"    Warning: article.full_content is empty or None")
 
-            # Build page properties
-            properties = {
-                "Title": {"title": [{"text": {"content": article.title[:100]}}]},
-                "Link": {"url": article.link},
-                "Author": {"rich_text": [{"text": {"content": article.author}}]},
-                "type": {"rich_text": [{"text": {"content": "blog"}}]},
-                "Status": {"status": {"name": "Not Started"}},
-            }
-
-            # Create page with content
-            children = self._build_page_content(article)
-            print(f"    Generated {len(children)} Notion blocks for content")
+            page_data = self._build_page_payload(article)
 
-            # Build page data
-            page_data = {
-                "parent": {"database_id": self.database_id},
-                "properties": properties,
-                "children": children,
-            }
-
-            # Add cover image (first image) - use parsed real URL
-            if article.image_urls:
-                # Parse real URL from Next.js proxy URLs
-                cover_url = self._parse_image_url(article.image_urls[0])
-                page_data["cover"] = {
-                    "type": "external",
-                    "external": {"url": cover_url},
-                }
+            # Debug output only when asked for (elided entirely under python -O)
+            if __debug__ and os.environ.get("NOTION_DEBUG"):
+                if article.full_content:
+                    print(f"    Article content length: {len(article.full_content)} chars")
+                    print(f"    Article content preview: {article.full_content[:100]}...")
+                print(f"    Generated {len(page_data['children'])} Notion blocks for content")
 
-            self.client.pages.create(**page_data)
+            page = self._create_page(page_data, idempotency_key=_idempotency_key(article.link))
+            self._mark_pushed(article.link, page.get("id"))
 
             print(f"  Synced to Notion")
             return True
@@ -97,6 +312,123 @@ class BlogNotionManager:
                 print("  Hint: Property names may not match your database schema")
             return False
 
+    def push_articles_to_notion(
+        self, articles: List["Article"], max_workers: int = 3
+    ) -> List[bool]:
+        """
+        Push several articles to Notion concurrently
+
+        Each page create is an independent round trip, so up to max_workers
+        run at once; the shared rate limiter keeps the total under Notion's
+        3 requests per second.
+
+        Returns:
+            Per-article success flags, in input order
+        """
+        if not self.enabled or not articles:
+            return [False] * len(articles)
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(articles)), thread_name_prefix="notion-push"
+        ) as pool:
+            return list(pool.map(self.push_article_to_notion, articles))
+
+    def _build_page_payload(self, article: "Article") -> dict:
+        """Build the pages.create payload (properties, content blocks, cover) for an article"""
+        # Build page properties
+        properties = {
+            "Title": {"title": [{"text": {"content": article.title[:100]}}]},
+            "Link": {"url": article.link},
+            "Author": {"rich_text": [{"text": {"content": article.author}}]},
+            "type": {"rich_text": [{"text": {"content": "blog"}}]},
+            "Status": {"status": {"name": "Not Started"}},
+        }
+        # Skip properties the database does not define instead of failing the create
+        if self._allowed_props is not None:
+            properties = {k: v for k, v in properties.items() if k in self._allowed_props}
+
+        # Build page data with content
+        page_data = {
+            "parent": {"database_id": self.database_id},
+            "properties": properties,
+            "children": self._build_page_content(article),
+        }
+
+        # Add cover image (first image) - use parsed real URL
+        if article.image_urls:
+            # Parse real URL from Next.js proxy URLs
+            cover_url = _parse_image_url(article.image_urls[0])
+            page_data["cover"] = {
+                "type": "external",
+                "external": {"url": cover_url},
+            }
+
+        return page_data
+
+    def _create_page(self, page_data: dict, idempotency_key: Optional[str] = None) -> dict:
+        """
+        Create a page with its content blocks
+
+        Notion accepts at most 100 children per request, so the page is
+        created with the first 100 and the rest are appended in 100-block
+        batches (sequentially, to keep their order).
+        """
+        children = page_data.get("children", [])
+        page = self._send_json(
+            "POST",
+            "/pages",
+            {**page_data, "children": children[:_MAX_CHILDREN]},
+            headers={"Idempotency-Key": idempotency_key} if idempotency_key else None,
+        )
+        for start in range(_MAX_CHILDREN, len(children), _MAX_CHILDREN):
+            self._send_json(
+                "PATCH",
+                f"/blocks/{page['id']}/children",
+                {"children": children[start : start + _MAX_CHILDREN]},
+            )
+        return page
+
+    def _send_json(
+        self, method: str, path: str, payload: dict, headers: Optional[dict] = None
+    ) -> dict:
+        """Send a JSON request (with retries) and return the decoded response"""
+        # Serialize once; the body (and headers) are re-sent unchanged on retries
+        body = _dumps(payload)
+        resp = self._retry(
+            self._notion_request,
+            method,
+            path,
+            data=body,
+            headers={"Content-Type": "application/json", **(headers or {})},
+        )
+        if not resp.ok:
+            # Surface Notion's error message (used for the sync hints)
+            try:
+                message = resp.json().get("message", resp.text)
+            except ValueError:
+                message = resp.text
+            raise requests.HTTPError(f"{resp.status_code}: {message}", response=resp)
+        return resp.json()
+
+    def _retry(self, fn, *args, max_attempts: int = 6, **kwargs) -> requests.Response:
+        """
+        Call fn (which returns a Response) until it is not a 429/5xx
+
+        Waits Retry-After when Notion sends it, otherwise backs off
+        exponentially with jitter (capped at 32 s). The last response is
+        returned as-is once attempts run out.
+        """
+        for attempt in range(max_attempts):
+            resp = fn(*args, **kwargs)
+            if resp.status_code not in _RETRY_STATUSES or attempt == max_attempts - 1:
+                return resp
+            try:
+                delay = float(resp.headers["Retry-After"])
+            except (KeyError, TypeError, ValueError):
+                delay = min(32.0, 2 ** attempt + random.random())
+            print(f"    Notion returned {resp.status_code}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
     def _build_page_content(self, article: "Article") -> list:
         """Build Notion page content blocks - article text and images"""
         children = []
@@ -107,113 +439,28 @@ class BlogNotionManager:
             content_blocks = self._markdown_to_blocks(article.full_content)
             children.extend(content_blocks)
 
-        # Add images from original article
+        # Add images from original article: divider + section header, then
+        # images using external URLs (limit to 10 for performance)
         if article.image_urls:
-            # Add a divider before images
-            children.append({"type": "divider", "divider": {}})
-            # Add section header
-            children.append(
-                {
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [{"type": "text", "text": {"content": "文章图片"}}]
-                    },
-                }
-            )
-            # Add images using external URLs (limit to 10 for performance)
-            for img_url in article.image_urls[:10]:
-                # Parse real URL from proxy URLs
-                real_url = self._parse_image_url(img_url)
-                children.append(
+            children.extend(_IMAGE_SECTION_PRELUDE)
+            children.extend(
+                [
                     {
                         "type": "image",
-                        "image": {"type": "external", "external": {"url": real_url}},
+                        "image": {
+                            "type": "external",
+                            # Parse real URL from proxy URLs
+                            "external": {"url": _parse_image_url(img_url)},
+                        },
                     }
-                )
-
-        # Notion API limit: max 100 children per page
-        if len(children) > 100:
-            children = children[:100]
-            print(f"    Content truncated to 100 blocks (Notion API limit)")
-
-        return children
-
-    def _upload_image_to_notion(self, image_url: str) -> Optional[str]:
-        """Upload image to Notion and return file URL"""
-        try:
-            # Parse real image URL from Next.js proxy URLs
-            real_url = self._parse_image_url(image_url)
-
-            # 1. Download image to temp file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as tmp:
-                response = requests.get(
-                    real_url, headers={"User-Agent": "Mozilla/5.0"}, timeout=15
-                )
-                response.raise_for_status()
-                tmp.write(response.content)
-                tmp_path = tmp.name
-
-            # 2. Create upload object
-            notion_key = os.getenv("notion_key")
-            resp = requests.post(
-                "https://api.notion.com/v1/file_uploads",
-                headers={
-                    "Authorization": f"Bearer {notion_key}",
-                    "Notion-Version": "2022-06-28",
-                    "Content-Type": "application/json",
-                },
-                json={},
+                    for img_url in article.image_urls[:10]
+                ]
             )
-            resp.raise_for_status()
-            upload_obj = resp.json()
-            upload_id = upload_obj["id"]
-
-            # 3. Send file content
-            mime = mimetypes.guess_type(tmp_path)[0] or "image/jpeg"
-            with open(tmp_path, "rb") as f:
-                resp = requests.post(
-                    f"https://api.notion.com/v1/file_uploads/{upload_id}/send",
-                    headers={
-                        "Authorization": f"Bearer {notion_key}",
-                        "Notion-Version": "2022-06-28",
-                    },
-                    files={"file": (os.path.basename(tmp_path), f, mime)},
-                )
-            resp.raise_for_status()
-            result = resp.json()
-
-            # 4. Clean up temp file
-            os.remove(tmp_path)
-
-            # Return the upload_id for Notion to use
-            # Notion will use this to reference the uploaded file
-            return upload_id
-
-        except Exception as e:
-            print(f"    Image upload failed: {e}")
-            return None
 
-    def _parse_image_url(self, url: str) -> str:
-        """Parse real image URL from Next.js proxy URLs"""
-        try:
-            from urllib.parse import urlparse, parse_qs, unquote_plus
-
-            # Check if it's a Next.js image proxy URL
-            if "/_next/image" in url:
-                parsed = urlparse(url)
-                query = parse_qs(parsed.query)
-                # Get the real URL from the 'url' parameter
-                real_url = query.get("url", [url])[0]
-                return unquote_plus(real_url)
-
-            return url
-        except:
-            return url
+        return children
 
     def _markdown_to_blocks(self, md_text: str) -> list:
         """Convert Markdown text to Notion blocks"""
-        import re
-
         blocks = []
         lines = md_text.split("\n")
 
@@ -226,111 +473,63 @@ class BlogNotionManager:
                 i += 1
                 continue
 
-            # Heading 1-3
-            if line.startswith("### "):
-                blocks.append(
-                    {
-                        "type": "heading_3",
-                        "heading_3": {
-                            "rich_text": [
-                                {"type": "text", "text": {"content": line[4:]}}
-                            ]
-                        },
-                    }
-                )
-                i += 1
-            elif line.startswith("## "):
-                blocks.append(
-                    {
-                        "type": "heading_2",
-                        "heading_2": {
-                            "rich_text": [
-                                {"type": "text", "text": {"content": line[3:]}}
-                            ]
-                        },
-                    }
-                )
+            # Headings and bulleted lists: one first-character check, then a
+            # scan of the prefix table (most specific prefix first)
+            block_type = None
+            if line[0] in _PREFIX_CHARS:
+                for prefix, strip_len, block_type in _PREFIX_TABLE:
+                    if line.startswith(prefix):
+                        break
+                else:
+                    block_type = None
+
+            if block_type == "bulleted_list_item":
+                blocks.append(_block(block_type, self._parse_inline_formatting(line[strip_len:])))
                 i += 1
-            elif line.startswith("# "):
+            elif block_type:
                 blocks.append(
-                    {
-                        "type": "heading_1",
-                        "heading_1": {
-                            "rich_text": [
-                                {"type": "text", "text": {"content": line[2:]}}
-                            ]
-                        },
-                    }
+                    _block(block_type, [{"type": "text", "text": {"content": line[strip_len:]}}])
                 )
                 i += 1
 
-            # Horizontal rule
-            elif line.strip() == "---":
-                blocks.append({"type": "divider", "divider": {}})
-                i += 1
-
-            # Unordered list (- *)
-            elif line.startswith(("- ", "* ")):
-                text = line[2:]
-                blocks.append(
-                    {
-                        "type": "bulleted_list_item",
-                        "bulleted_list_item": {
-                            "rich_text": self._parse_inline_formatting(text)
-                        },
-                    }
-                )
+            # Horizontal rule (line is already rstripped, so check the last
+            # character before comparing)
+            elif line[-1] == "-" and line.lstrip() == "---":
+                blocks.append(_DIVIDER)
                 i += 1
 
             # Ordered list (1. 2. 3.)
-            elif re.match(r"^\d+\.\s", line):
-                text = re.sub(r"^\d+\.\s", "", line)
-                blocks.append(
-                    {
-                        "type": "numbered_list_item",
-                        "numbered_list_item": {
-                            "rich_text": self._parse_inline_formatting(text)
-                        },
-                    }
-                )
+            elif line[0].isdigit() and _ORDERED_RE.match(line):
+                text = _ORDERED_RE.sub("", line, count=1)
+                blocks.append(_block("numbered_list_item", self._parse_inline_formatting(text)))
                 i += 1
 
             # Regular paragraph
             else:
-                blocks.append(
-                    {
-                        "type": "paragraph",
-                        "paragraph": {"rich_text": self._parse_inline_formatting(line)},
-                    }
-                )
+                blocks.append(_para(self._parse_inline_formatting(line)))
                 i += 1
 
         return blocks
 
     def _parse_inline_formatting(self, text: str) -> list:
         """Parse inline Markdown formatting (bold) to Notion rich text array"""
+        # Most lines have no bold markers at all
+        if "**" not in text:
+            return list(_text_parts(text))
+
+        # One regex pass over **bold** spans; an unclosed ** stays literal and
+        # empty spans (****) are dropped
         parts = []
-        remaining = text
-
-        while remaining:
-            # Find bold markers
-            if remaining.startswith("**"):
-                end = remaining.find("**", 2)
-                if end != -1:
-                    bold_content = remaining[2:end]
-                    parts.append(
-                        {
-                            "type": "text",
-                            "text": {"content": bold_content[:1999]},
-                            "annotations": {"bold": True},
-                        }
-                    )
-                    remaining = remaining[end + 2 :]
-                    continue
-
-            # No more bold, add rest as plain text
-            if remaining:
-                parts.append({"type": "text", "text": {"content": remaining[:1999]}})
-                break
-
-        return parts if parts else [{"type": "text", "text": {"content": text[:1999]}}]
+        pos = 0
+        for match in _BOLD_RE.finditer(text):
+            if match.start() > pos:
+                parts.extend(_text_parts(text[pos : match.start()]))
+            if match.end() - match.start() > 4:
+                parts.extend(_text_parts(match.group(1), bold=True))
+            pos = match.end()
+
+        # No more bold, add rest as plain text
+        if pos < len(text):
+            parts.extend(_text_parts(text[pos:]))
+
+        return parts if parts else list(_text_parts(text))
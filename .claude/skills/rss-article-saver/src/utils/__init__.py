@@ -1,3 +1,4 @@
-from .text_utils import clean_text, split_text_to_blocks, build_paragraph_blocks, parse_published_time
+from .text_utils import clean_text, split_text_to_blocks, iter_paragraph_blocks, build_paragraph_blocks, parse_published_time
+from .fast_feedparser import ParsedFeed, parse_bytes, to_plain_entries
 
-__all__ = ['clean_text', 'split_text_to_blocks', 'build_paragraph_blocks', 'parse_published_time']
+__all__ = ['clean_text', 'split_text_to_blocks', 'iter_paragraph_blocks', 'build_paragraph_blocks', 'parse_published_time', 'ParsedFeed', 'parse_bytes', 'to_plain_entries']
@@ -0,0 +1,164 @@
+"""
+Fast feed parser - lxml based RSS/Atom entry extraction
+
+Only pulls the fields RSSManager reads from an entry (title, link, author,
+published, summary/description, content) and skips feedparser's relative
+URI resolution and HTML sanitizing; content is cleaned downstream anyway.
+Falls back to feedparser when lxml is missing or the document is not
+well-formed XML.
+"""
+
+import io
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import feedparser
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml is a declared dependency
+    etree = None
+
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_RSS1 = "{http://purl.org/rss/1.0/}"
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+
+_ENTRY_TAGS = ("item", f"{_RSS1}item", f"{_ATOM}entry")
+
+# Entry fields RSSManager reads; everything else feedparser produces is dropped
+_ENTRY_FIELDS = ("title", "link", "author", "published", "summary", "description")
+
+
+@dataclass
+class ParsedFeed:
+    """Minimal stand-in for feedparser's result object"""
+
+    entries: List[Dict[str, Any]] = field(default_factory=list)
+    bozo: bool = False
+    bozo_exception: Optional[Exception] = None
+
+
+def _text(element, path: str) -> str:
+    """Stripped text of the first matching child, or empty string"""
+    value = element.findtext(path)
+    return value.strip() if value else ""
+
+
+def _atom_content(element) -> str:
+    """Atom content/summary text, serializing inline XHTML children"""
+    if element is None:
+        return ""
+    if len(element):
+        return "".join(
+            etree.tostring(child, encoding="unicode", with_tail=True)
+            for child in element
+        ).strip()
+    return (element.text or "").strip()
+
+
+def _parse_rss_item(item, ns: str = "") -> Dict[str, Any]:
+    """Extract entry fields from an RSS 0.9x/1.0/2.0 <item>"""
+    description = _text(item, f"{ns}description")
+    content = _text(item, _CONTENT_ENCODED)
+
+    link = _text(item, f"{ns}link")
+    if not link:
+        guid = item.find("guid")
+        if guid is not None and guid.get("isPermaLink", "true") != "false":
+            link = (guid.text or "").strip()
+
+    entry = {
+        "title": _text(item, f"{ns}title"),
+        "link": link,
+        "author": _text(item, "author") or _text(item, f"{_DC}creator"),
+        "published": _text(item, "pubDate") or _text(item, f"{_DC}date"),
+        "summary": description,
+        "description": description,
+        "content": [{"value": content}] if content else None,
+    }
+    return {key: value for key, value in entry.items() if value}
+
+
+def _parse_atom_entry(entry_el) -> Dict[str, Any]:
+    """Extract entry fields from an Atom <entry>"""
+    link = ""
+    for link_el in entry_el.iterfind(f"{_ATOM}link"):
+        if link_el.get("rel", "alternate") == "alternate":
+            link = link_el.get("href", "")
+            break
+
+    summary = _atom_content(entry_el.find(f"{_ATOM}summary"))
+    content = _atom_content(entry_el.find(f"{_ATOM}content"))
+
+    entry = {
+        "title": _text(entry_el, f"{_ATOM}title"),
+        "link": link,
+        "author": _text(entry_el, f"{_ATOM}author/{_ATOM}name"),
+        "published": _text(entry_el, f"{_ATOM}published"),
+        "summary": summary,
+        "description": summary,
+        "content": [{"value": content}] if content else None,
+    }
+    return {key: value for key, value in entry.items() if value}
+
+
+def to_plain_entries(entries) -> List[Dict[str, Any]]:
+    """
+    Reduce parsed entries to plain, picklable dicts
+
+    Args:
+        entries: Entries from parse_bytes or feedparser
+
+    Returns:
+        List of dicts holding only the fields RSSManager reads
+    """
+    plain = []
+    for entry in entries:
+        item = {key: entry.get(key) for key in _ENTRY_FIELDS if entry.get(key)}
+        content = entry.get("content")
+        if content:
+            item["content"] = [{"value": part.get("value", "")} for part in content]
+        plain.append(item)
+    return plain
+
+
+def parse_bytes(content: bytes):
+    """
+    Parse a downloaded RSS/Atom document
+
+    Args:
+        content: Raw feed bytes
+
+    Returns:
+        ParsedFeed with plain-dict entries, or feedparser's result when the
+        fast path cannot handle the document
+    """
+    if etree is None:
+        return feedparser.parse(content)
+
+    entries = []
+    try:
+        for _, element in etree.iterparse(
+            io.BytesIO(content), events=("end",), tag=_ENTRY_TAGS
+        ):
+            if element.tag == f"{_ATOM}entry":
+                entries.append(_parse_atom_entry(element))
+            elif element.tag == f"{_RSS1}item":
+                entries.append(_parse_rss_item(element, _RSS1))
+            else:
+                entries.append(_parse_rss_item(element))
+
+            # Free already-processed siblings to bound memory on large feeds
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+    except etree.XMLSyntaxError:
+        return feedparser.parse(content)
+
+    if not entries:
+        # Unknown layout or empty feed: let feedparser have the final say
+        return feedparser.parse(content)
+
+    return ParsedFeed(entries=entries)
@@ -3,7 +3,15 @@
 """
 
 import re
-from typing import List, Dict, Any
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional
+
+try:
+    from lxml.html import fromstring as _html_fromstring
+except ImportError:  # 未安装 lxml 时退回正则移除标签
+    _html_fromstring = None
 
 
 def clean_text(text: str) -> str:
@@ -11,12 +19,21 @@ def clean_text(text: str) -> str:
     if not text or text == "无内容":
         return ""
 
-    # 移除HTML标签
-    clean_text = re.sub(r'<[^>]+>', '', str(text))
+    text = str(text)
+    # 不含标签时只需压缩空白字符
+    if '<' not in text:
+        return ' '.join(text.split())
+
+    # 由 lxml（libxml2）解析并提取纯文本，失败时退回正则移除标签
+    if _html_fromstring is not None:
+        try:
+            text = _html_fromstring(text).text_content()
+        except Exception:
+            text = re.sub(r'<[^>]+>', '', text)
+    else:
+        text = re.sub(r'<[^>]+>', '', text)
     # 移除多余的空白字符
-    clean_text = ' '.join(clean_text.split())
-
-    return clean_text
+    return ' '.join(text.split())
 
 
 def split_text_to_blocks(text: str, max_length: int = 1900) -> List[str]:
@@ -37,14 +54,15 @@ def split_text_to_blocks(text: str, max_length: int = 1900) -> List[str]:
     return segments
 
 
-def build_paragraph_blocks(text: str) -> List[Dict[str, Any]]:
-    """将文本构建为多个段落块"""
-    blocks = []
-    segments = split_text_to_blocks(text)
+def iter_paragraph_blocks(text: str, max_length: int = 1900) -> Iterator[Dict[str, Any]]:
+    """按指定长度分段并逐个生成段落块（跳过空白段落，不构建中间列表）"""
+    if not text:
+        return
 
-    for segment in segments:
+    for i in range(0, len(text), max_length):
+        segment = text[i:i + max_length]
         if segment.strip():  # 只添加非空段落
-            blocks.append({
+            yield {
                 "object": "block",
                 "type": "paragraph",
                 "paragraph": {
@@ -53,23 +71,28 @@ def build_paragraph_blocks(text: str) -> List[Dict[str, Any]]:
                         "text": {"content": segment}
                     }]
                 }
-            })
+            }
 
-    return blocks
 
+def build_paragraph_blocks(text: str) -> List[Dict[str, Any]]:
+    """将文本构建为多个段落块"""
+    return list(iter_paragraph_blocks(text))
 
-def parse_published_time(published_str: str) -> str:
-    """解析发布时间并格式化为 ISO 格式"""
-    from datetime import datetime, timezone
 
+@lru_cache(maxsize=4096)
+def _parse_rfc2822(published_str: str) -> Optional[str]:
+    """解析 RFC 2822 时间字符串为 ISO 格式（按字符串缓存），失败返回 None"""
     try:
-        if not published_str or published_str == "无时间":
-            return datetime.now(timezone.utc).isoformat()
-
-        # 尝试解析常见的时间格式
-        from email.utils import parsedate_to_datetime
-        dt = parsedate_to_datetime(published_str)
-        return dt.isoformat()
+        return parsedate_to_datetime(published_str).isoformat()
     except Exception as e:
         print(f"时间解析失败: {e}, 使用当前时间")
+        return None
+
+
+def parse_published_time(published_str: str) -> str:
+    """解析发布时间并格式化为 ISO 格式"""
+    # 空值与解析失败都回退到当前时间，这部分不能缓存
+    if not published_str or published_str == "无时间":
         return datetime.now(timezone.utc).isoformat()
+
+    return _parse_rfc2822(published_str) or datetime.now(timezone.utc).isoformat()
@@ -0,0 +1,59 @@
+import json
+from unittest import mock
+
+from src.ai.nvidia_client import NVIDIATranslator
+
+
+def _reply(content: str) -> mock.Mock:
+    response = mock.Mock(status_code=200)
+    response.json.return_value = {"choices": [{"message": {"content": content}}]}
+    return response
+
+
+def _translator(monkeypatch) -> NVIDIATranslator:
+    monkeypatch.setenv("NVIDIA_API_KEY", "test-key")
+    return NVIDIATranslator()
+
+
+def test_translate_batch_splits_json_array(monkeypatch):
+    translator = _translator(monkeypatch)
+    # Models often think out loud before the JSON object
+    reply = _reply(
+        "Let me translate these.\n"
+        + json.dumps({"translations": ["一", "二", "三"]}, ensure_ascii=False)
+    )
+    with mock.patch("src.ai.nvidia_client.requests.post", return_value=reply) as post:
+        assert translator.translate_batch(["one", "two", "three"]) == ["一", "二", "三"]
+
+    assert post.call_count == 1
+    prompt = post.call_args.kwargs["json"]["messages"][0]["content"]
+    assert '["one", "two", "three"]' in prompt
+    assert "exactly 3 strings" in prompt
+
+
+def test_translate_batch_falls_back_on_count_mismatch(monkeypatch):
+    translator = _translator(monkeypatch)
+    replies = [
+        # The batch reply merged both items into one
+        _reply(json.dumps({"translations": ["一二"]}, ensure_ascii=False)),
+        _reply(json.dumps({"translation": "一"}, ensure_ascii=False)),
+        _reply(json.dumps({"translation": "二"}, ensure_ascii=False)),
+    ]
+    with mock.patch("src.ai.nvidia_client.requests.post", side_effect=replies) as post:
+        assert translator.translate_batch(["one", "two"]) == ["一", "二"]
+
+    # One batch request, then one request per text; no retries of the batch
+    assert post.call_count == 3
+
+
+def test_timeout_scales_with_payload_size(monkeypatch):
+    translator = _translator(monkeypatch)
+    reply = _reply(json.dumps({"translations": ["一", "二"]}, ensure_ascii=False))
+    timeouts = []
+    for size in (100, 20000):
+        with mock.patch("src.ai.nvidia_client.requests.post", return_value=reply) as post:
+            translator.translate_batch(["a" * size, "b" * size], max_chars_per_req=50000)
+        timeouts.append(post.call_args.kwargs["timeout"])
+
+    assert timeouts[0] < timeouts[1]
+    assert timeouts[1] >= 60 + 40000 / 100
@@ -0,0 +1,22 @@
+import pytest
+
+from src.managers.rss_manager import _clean_html_to_markdown
+
+
+@pytest.mark.parametrize(
+    "body, text",
+    [
+        ("<pre><code>print(1)</code></pre>", "print(1)"),
+        ("<table><tr><td>cell</td></tr></table>", "cell"),
+        ("<figure><figcaption>caption</figcaption></figure><hr/>", "caption"),
+    ],
+)
+def test_any_html_tag_triggers_cleanup(body, text):
+    cleaned = _clean_html_to_markdown(body)
+    assert "<" not in cleaned
+    assert text in cleaned
+
+
+def test_text_without_tags_is_kept():
+    text = "if a < b and b > c:\n\n    return a"
+    assert _clean_html_to_markdown(text) == text
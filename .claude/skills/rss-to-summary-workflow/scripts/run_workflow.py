@@ -2,12 +2,18 @@
 """Run configured multi-skill workflows and log per-step timings."""
 
 import argparse
+import functools
 import json
+import os
+import signal
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional, TextIO
 
 try:
     import yaml  # type: ignore
@@ -17,11 +23,16 @@ except Exception:  # pragma: no cover - optional dependency
 
 DEFAULT_TIMEOUT_SECONDS = None
 
+# Serializes log writes from steps running in the same parallel group
+_LOG_LOCK = threading.Lock()
+
 
 def _load_config(path: Path) -> dict:
     text = path.read_text(encoding="utf-8")
     if yaml:
-        data = yaml.safe_load(text)
+        # C loader (libyaml) when available, same semantics as safe_load
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(text, Loader=loader)
         return data or {}
 
     try:
@@ -33,13 +44,25 @@ def _load_config(path: Path) -> dict:
         ) from exc
 
 
+@functools.cache
 def _find_repo_root(skill_root: Path) -> Path:
+    # An explicit (or inherited) root wins over walking the parents
+    env_root = os.environ.get("CCTOOLS_REPO_ROOT")
+    if env_root:
+        return Path(env_root)
+
+    root = skill_root.parent
     for parent in [skill_root] + list(skill_root.parents):
         if parent.name == ".claude":
-            return parent.parent
-    if len(skill_root.parents) >= 3:
-        return skill_root.parents[3]
-    return skill_root.parent
+            root = parent.parent
+            break
+    else:
+        if len(skill_root.parents) >= 3:
+            root = skill_root.parents[3]
+
+    # Step subprocesses inherit the resolved root
+    os.environ["CCTOOLS_REPO_ROOT"] = str(root)
+    return root
 
 
 def _print_workflows(config: dict) -> None:
@@ -58,10 +81,96 @@ def _print_workflows(config: dict) -> None:
         print(f"- {name}: {steps_label}")
 
 
-def _log_step(log_file: Path, record: dict) -> None:
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-    with log_file.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+def _log_step(log_fp: TextIO, record: dict) -> None:
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with _LOG_LOCK:
+        log_fp.write(line)
+
+
+def _group_steps(steps: list) -> list:
+    """Split steps into runs of consecutive steps sharing a parallel_group.
+
+    Steps without a parallel_group form single-step runs. Each entry is a
+    list of (step_index, step) pairs.
+    """
+    groups = []
+    prev_group = None
+    for idx, step in enumerate(steps, start=1):
+        group = step.get("parallel_group") if isinstance(step, dict) else None
+        if group and group == prev_group:
+            groups[-1].append((idx, step))
+        else:
+            groups.append([(idx, step)])
+        prev_group = group
+    return groups
+
+
+def _stream_step(
+    command: list,
+    *,
+    cwd: Path,
+    timeout_seconds,
+    workflow_name: str,
+    step_index: int,
+    skill_name: str,
+    log_fp: TextIO,
+) -> tuple:
+    """Run a step command, echoing and logging each output line as it arrives.
+
+    stdout and stderr are merged; every line is printed with the skill name as
+    prefix (so parallel steps stay readable) and appended to the run log with
+    a timestamp. Returns (exit_code, timed_out).
+    """
+    proc = subprocess.Popen(
+        command,
+        cwd=str(cwd),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+        bufsize=1,
+        # Python children would otherwise block-buffer output into the pipe
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
+        # Own process group, so a timeout also reaches grandchildren that
+        # inherited the pipe (e.g. commands run through a shell)
+        start_new_session=True,
+    )
+
+    timed_out = threading.Event()
+    timer = None
+    if timeout_seconds:
+        def _kill() -> None:
+            timed_out.set()
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+        timer = threading.Timer(timeout_seconds, _kill)
+        timer.daemon = True
+        timer.start()
+
+    try:
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            print(f"  [{skill_name}] {line}")
+            _log_step(
+                log_fp,
+                {
+                    "workflow": workflow_name,
+                    "step": step_index,
+                    "skill": skill_name,
+                    "time": datetime.now(timezone.utc).isoformat(),
+                    "output": line,
+                },
+            )
+        exit_code = proc.wait()
+    finally:
+        if timer is not None:
+            timer.cancel()
+        proc.stdout.close()
+
+    return exit_code, timed_out.is_set()
 
 
 def _run_step(
@@ -72,7 +181,7 @@ def _run_step(
     skill_config: dict,
     repo_root: Path,
     dry_run: bool,
-    log_file: Path,
+    log_fp: Optional[TextIO],
 ) -> bool:
     path_value = skill_config.get("path")
     command = skill_config.get("command")
@@ -106,18 +215,20 @@ def _run_step(
     exit_code = 0
 
     try:
-        completed = subprocess.run(
+        exit_code, timed_out = _stream_step(
             command,
-            cwd=str(skill_path),
-            timeout=timeout_seconds,
-            check=False,
+            cwd=skill_path,
+            timeout_seconds=timeout_seconds,
+            workflow_name=workflow_name,
+            step_index=step_index,
+            skill_name=skill_name,
+            log_fp=log_fp,
         )
-        exit_code = completed.returncode
-        if exit_code != 0:
+        if timed_out:
+            status = "timeout"
+            exit_code = None
+        elif exit_code != 0:
             status = "failed"
-    except subprocess.TimeoutExpired:
-        status = "timeout"
-        exit_code = None
     except Exception as exc:
         status = "error"
         exit_code = None
@@ -136,7 +247,7 @@ def _run_step(
         "status": status,
         "exit_code": exit_code,
     }
-    _log_step(log_file, record)
+    _log_step(log_fp, record)
 
     print(
         f"  status: {status} | exit_code: {exit_code} | duration: {duration_seconds}s"
@@ -182,32 +293,55 @@ def main() -> int:
     repo_root = _find_repo_root(skill_root)
     log_file = skill_root / "logs" / "workflow_runs.jsonl"
 
-    for idx, step in enumerate(steps, start=1):
-        if not isinstance(step, dict) or "skill" not in step:
-            print(f"Step {idx}: invalid step definition")
-            return 1
-
-        skill_name = step["skill"]
-        skill_config = skills.get(skill_name)
-        if not skill_config:
-            print(f"Step {idx}: skill not found in skills config: {skill_name}")
-            return 1
-
-        ok = _run_step(
-            workflow_name=args.workflow,
-            step_index=idx,
-            skill_name=skill_name,
-            skill_config=skill_config,
-            repo_root=repo_root,
-            dry_run=args.dry_run,
-            log_file=log_file,
-        )
-        if not ok:
-            print("Workflow stopped due to failure")
-            return 1
+    # One line-buffered handle for the whole run (none needed for dry runs)
+    log_fp = None
+    if not args.dry_run:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        log_fp = log_file.open("a", encoding="utf-8", buffering=1)
 
-    print("Workflow completed")
-    return 0
+    try:
+        for group in _group_steps(steps):
+            step_kwargs = []
+            for idx, step in group:
+                if not isinstance(step, dict) or "skill" not in step:
+                    print(f"Step {idx}: invalid step definition")
+                    return 1
+
+                skill_name = step["skill"]
+                skill_config = skills.get(skill_name)
+                if not skill_config:
+                    print(f"Step {idx}: skill not found in skills config: {skill_name}")
+                    return 1
+
+                step_kwargs.append(
+                    dict(
+                        workflow_name=args.workflow,
+                        step_index=idx,
+                        skill_name=skill_name,
+                        skill_config=skill_config,
+                        repo_root=repo_root,
+                        dry_run=args.dry_run,
+                        log_fp=log_fp,
+                    )
+                )
+
+            if len(step_kwargs) == 1:
+                ok = _run_step(**step_kwargs[0])
+            else:
+                # Steps are subprocesses, so threads are enough to run them side by side
+                print(f"Running steps {group[0][0]}-{group[-1][0]} in parallel")
+                with ThreadPoolExecutor(max_workers=len(step_kwargs)) as pool:
+                    futures = [pool.submit(_run_step, **kwargs) for kwargs in step_kwargs]
+                    ok = all([future.result() for future in futures])
+            if not ok:
+                print("Workflow stopped due to failure")
+                return 1
+
+        print("Workflow completed")
+        return 0
+    finally:
+        if log_fp is not None:
+            log_fp.close()
 
 
 if __name__ == "__main__":
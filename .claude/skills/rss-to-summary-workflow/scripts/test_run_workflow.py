@@ -0,0 +1,50 @@
+import io
+import time
+from pathlib import Path
+
+from run_workflow import _stream_step
+
+
+def test_timeout_kills_grandchildren():
+    # The shell forks sleep, which holds the output pipe open; the timeout
+    # has to take down the whole process group for the read loop to end
+    log_fp = io.StringIO()
+    start = time.monotonic()
+    exit_code, timed_out = _stream_step(
+        ["sh", "-c", "sleep 4; echo done"],
+        cwd=Path(__file__).parent,
+        timeout_seconds=1,
+        workflow_name="test",
+        step_index=1,
+        skill_name="sleeper",
+        log_fp=log_fp,
+    )
+    elapsed = time.monotonic() - start
+
+    assert timed_out
+    assert exit_code != 0
+    assert elapsed < 3
+    assert "done" not in log_fp.getvalue()
+
+
+def test_output_is_streamed_and_logged():
+    log_fp = io.StringIO()
+    exit_code, timed_out = _stream_step(
+        ["sh", "-c", "echo one; echo two"],
+        cwd=Path(__file__).parent,
+        timeout_seconds=10,
+        workflow_name="test",
+        step_index=1,
+        skill_name="echo",
+        log_fp=log_fp,
+    )
+
+    assert (exit_code, timed_out) == (0, False)
+    logged = log_fp.getvalue()
+    assert '"output": "one"' in logged and '"output": "two"' in logged
+
+
+if __name__ == "__main__":
+    test_timeout_kills_grandchildren()
+    test_output_is_streamed_and_logged()
+    print("ok")
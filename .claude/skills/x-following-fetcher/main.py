@@ -3,19 +3,86 @@ X Following Fetcher - Fetches latest posts from X (Twitter) users you follow
 and saves them to Markdown format.
 """
 import json
+import os
 import re
 import shlex
-import subprocess
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib json module
+    orjson = None
 
 OUTPUT_DIR = Path("/home/say/work/github/cctools/mymind/post")
 X_CURL_FILE = Path(__file__).parent / "curl.txt"
+# Legacy id snapshot; only read to seed ID_LOG_FILE on first run
 CACHE_FILE = Path(__file__).parent / "posted_ids.json"
+ID_LOG_FILE = Path(__file__).parent / "posted_ids.log"
+
+
+def _loads(data: str | bytes) -> Any:
+    """Parse JSON text, with orjson when available"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write via a temp file and os.replace, so a crash never leaves a partial file"""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+# curl options whose value is irrelevant to the request and is skipped
+_CURL_OPTS_WITH_ARG = frozenset(
+    ("-o", "--output", "-m", "--max-time", "--connect-timeout", "-u", "--user", "-x", "--proxy")
+)
+
 
+@lru_cache(maxsize=None)
+def get_session() -> "requests.Session":
+    """Shared HTTP session (keep-alive pool, retries on transient errors)
 
+    requests is imported on first use, so importing this module or a run
+    that never reaches the network does not pay for it.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503]),
+        ),
+    )
+    return session
+
+
+# Shared read-only default for dict.get() lookups (never mutated)
+_EMPTY: dict[str, Any] = {}
+
+# Numeric prefix of saved Markdown files ("12_user_id.md")
+_INDEX_RE = re.compile(r'(\d+)_')
+# Filename / title cleanup patterns
+_PROTO_RE = re.compile(r'^https?[_:]')
+_UNDERSCORE_RE = re.compile(r'_+')
+_NUMID_RE = re.compile(r'/(\d{10,})')
+_WS_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=4096)
 def parse_twitter_date(twitter_date: str) -> str:
     """Convert Twitter date format to ISO 8601 format"""
     try:
@@ -26,61 +93,93 @@ def parse_twitter_date(twitter_date: str) -> str:
         return twitter_date
 
 
-def execute_curl_from_file() -> subprocess.CompletedProcess:
-    """从 curl.txt 读取 curl 命令并执行"""
-    if not X_CURL_FILE.exists():
-        raise FileNotFoundError(f"curl 文件不存在: {X_CURL_FILE}")
-
-    with open(X_CURL_FILE, "r", encoding="utf-8") as f:
-        curl_content = f.read().strip()
-
-    curl_cmd = curl_content.replace("\\\n", " ").replace("\\\r\n", " ")
-    cmd_list = shlex.split(curl_cmd)
-    return subprocess.run(
-        cmd_list,
-        capture_output=True,
-        text=True,
-        timeout=120,
-    )
+@lru_cache(maxsize=None)
+def parse_curl_file(path: Path) -> tuple[str, str, dict[str, str], str | None]:
+    """解析 curl.txt 中的 curl 命令为 (method, url, headers, data)"""
+    if not path.exists():
+        raise FileNotFoundError(f"curl 文件不存在: {path}")
+
+    curl_content = path.read_text(encoding="utf-8").strip()
+    curl_cmd = curl_content.replace("\\\r\n", " ").replace("\\\n", " ")
+    tokens = iter(shlex.split(curl_cmd))
+
+    method = None
+    url = ""
+    headers: dict[str, str] = {}
+    data = None
+    for token in tokens:
+        if token == "curl":
+            continue
+        if token in ("-H", "--header"):
+            name, _, value = next(tokens, "").partition(":")
+            headers[name.strip()] = value.strip()
+        elif token in ("-b", "--cookie"):
+            headers["Cookie"] = next(tokens, "")
+        elif token in ("-A", "--user-agent"):
+            headers["User-Agent"] = next(tokens, "")
+        elif token in ("-e", "--referer"):
+            headers["Referer"] = next(tokens, "")
+        elif token in ("-X", "--request"):
+            method = next(tokens, "").upper()
+        elif token in ("-d", "--data", "--data-raw", "--data-binary", "--data-ascii"):
+            data = next(tokens, "")
+        elif token == "--url":
+            url = next(tokens, "")
+        elif token in _CURL_OPTS_WITH_ARG:
+            next(tokens, None)
+        elif not token.startswith("-"):
+            url = token
+        # Other flags (--compressed, -s, -L, ...) take no argument
+
+    # requests negotiates the encodings it can actually decode
+    for name in [h for h in headers if h.lower() == "accept-encoding"]:
+        del headers[name]
+
+    return method or ("POST" if data is not None else "GET"), url, headers, data
+
+
+def request_from_curl_file() -> "requests.Response":
+    """按 curl.txt 中的请求直接发起 HTTP 请求"""
+    method, url, headers, data = parse_curl_file(X_CURL_FILE)
+    return get_session().request(method, url, headers=headers, data=data, timeout=120)
 
 
 def parse_tweet_entry(entry: dict[str, Any]) -> dict[str, Any] | None:
     try:
-        content = entry.get("content", {})
-        tweet = content.get("itemContent", {})
-
-        if tweet.get("__typename") == "TweetTombstone":
-            return None
-
-        tweet_results = tweet.get("tweet_results", {})
-        if not tweet_results:
+        # Direct indexing on the happy path; any missing level means there
+        # is no tweet to parse
+        try:
+            tweet = entry["content"]["itemContent"]
+            if tweet.get("__typename") == "TweetTombstone":
+                return None
+            result = tweet["tweet_results"]["result"]
+            legacy = result["legacy"]
+        except KeyError:
             return None
-
-        result = tweet_results.get("result", {})
-        legacy = result.get("legacy", {})
         if not legacy:
             return None
 
-        core = result.get("core", {})
-        user_results = core.get("user_results", {}).get("result", {})
-        user_core = user_results.get("core", {})
-        user_legacy = user_results.get("legacy", {})
-        user = user_core or user_legacy or {}
+        core = result.get("core", _EMPTY)
+        user_results = core.get("user_results", _EMPTY).get("result", _EMPTY)
+        user_core = user_results.get("core", _EMPTY)
+        user_legacy = user_results.get("legacy", _EMPTY)
+        user = user_core or user_legacy or _EMPTY
 
         user_name = user.get("name", "")
         user_screen_name = user.get("screen_name", "")
         user_verified = user_results.get("is_blue_verified", False) if user_results else False
 
-        avatar = user_results.get("avatar", {}) if user_results else {}
+        avatar = user_results.get("avatar", _EMPTY) if user_results else _EMPTY
         profile_image_url = avatar.get("image_url", "") if avatar else ""
 
-        extended_entities = legacy.get("extended_entities", {})
-        media = extended_entities.get("media", [])
-        image_urls = [
+        extended_entities = legacy.get("extended_entities", _EMPTY)
+        media = extended_entities.get("media", ())
+        # dict.fromkeys drops repeated media URLs in O(n), keeping order
+        image_urls = list(dict.fromkeys(
             m.get("media_url_https", m.get("media_url", ""))
             for m in media
             if m.get("type") == "photo"
-        ]
+        ))
 
         tweet_id = legacy.get("id_str", "")
         tweet_url = (
@@ -115,12 +214,24 @@ def parse_tweet_entry(entry: dict[str, Any]) -> dict[str, Any] | None:
 
 def fetch_tweets() -> list[dict[str, Any]]:
     try:
-        result = execute_curl_from_file()
-        if result.returncode != 0:
-            print(f"Error fetching tweets: {result.stderr}", file=sys.stderr)
+        parse_curl_file(X_CURL_FILE)
+    except Exception as e:
+        print(f"Error reading {X_CURL_FILE.name}: {e}", file=sys.stderr)
+        return []
+
+    # Only a run that actually sends the request loads the HTTP stack
+    import requests
+
+    try:
+        resp = request_from_curl_file()
+        if not resp.ok:
+            print(
+                f"Error fetching tweets: HTTP {resp.status_code} {resp.text[:500]}",
+                file=sys.stderr,
+            )
             return []
 
-        response = json.loads(result.stdout)
+        response = _loads(resp.content)
         instructions = (
             response.get("data", {})
             .get("home", {})
@@ -141,7 +252,7 @@ def fetch_tweets() -> list[dict[str, Any]]:
                             seen_ids.add(tweet_data["id"])
                             tweets.append(tweet_data)
         return tweets
-    except subprocess.TimeoutExpired:
+    except requests.Timeout:
         print("Error: Request timed out", file=sys.stderr)
         return []
     except json.JSONDecodeError as e:
@@ -152,21 +263,26 @@ def fetch_tweets() -> list[dict[str, Any]]:
         return []
 
 
-def load_cached_ids() -> set:
-    if not CACHE_FILE.exists():
-        return set()
+def _load_legacy_ids() -> set:
+    """Ids from the old posted_ids.json snapshot ({"ids": [...]})"""
     try:
-        with open(CACHE_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return set(data.get("ids", []))
+        data = _loads(CACHE_FILE.read_bytes())
+        return set(data.get("ids", []))
     except Exception:
         return set()
 
 
-def save_cached_ids(ids: set) -> None:
-    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump({"ids": sorted(ids)}, f, ensure_ascii=False, indent=2)
+def load_cached_ids() -> set:
+    """Load saved tweet ids from the append-only log (one id per line)"""
+    if not ID_LOG_FILE.exists():
+        if not CACHE_FILE.exists():
+            return set()
+        # One-time migration from the JSON snapshot to the log
+        ids = _load_legacy_ids()
+        _atomic_write(ID_LOG_FILE, "".join(f"{i}\n" for i in sorted(ids)).encode("utf-8"))
+        return ids
+
+    return set(ID_LOG_FILE.read_text(encoding="utf-8").split())
 
 
 def sanitize_filename(name: str) -> str:
@@ -176,9 +292,9 @@ def sanitize_filename(name: str) -> str:
     for char in invalid_chars:
         name = name.replace(char, "_")
     # Remove protocol prefixes if present
-    name = re.sub(r'^https?[_:]', '', name)
+    name = _PROTO_RE.sub('', name)
     # Clean up multiple underscores
-    name = re.sub(r'_+', '_', name)
+    name = _UNDERSCORE_RE.sub('_', name)
     return name.strip('_').strip()
 
 
@@ -189,7 +305,7 @@ def clean_tweet_id(tweet_id: str) -> str:
         tweet_id = tweet_id[4:]
     # Extract numeric ID if it's a URL
     # Pattern: https://www.bestblogs.dev/feeds/123456789
-    match = re.search(r'/(\d{10,})', tweet_id)
+    match = _NUMID_RE.search(tweet_id)
     if match:
         return match.group(1)
     # Fallback: just sanitize the ID
@@ -206,7 +322,7 @@ def tweet_to_markdown(tweet: dict[str, Any]) -> str:
 
     # Clean up title by removing extra whitespace
     if title:
-        title = re.sub(r'\s+', ' ', title).strip()
+        title = _WS_RE.sub(' ', title).strip()
         lines.append(f"# {title}\n")
     else:
         # Use first line of content as title
@@ -274,44 +390,45 @@ def save_to_markdown(tweets: list[dict[str, Any]]) -> tuple[int, int]:
     new_tweets.sort(key=sort_key)
 
     # Determine starting index based on existing files in today's directory
+    # (single scan; the listing is reused for the total count below)
+    existing_files = [md_file.name for md_file in date_dir.glob("*.md")]
     start_index = 0
-    for md_file in date_dir.glob("*.md"):
-        match = re.match(r'(\d+)_', md_file.name)
+    for name in existing_files:
+        match = _INDEX_RE.match(name)
         if match:
             try:
                 start_index = max(start_index, int(match.group(1)))
             except Exception:
                 continue
 
-    for i, tweet in enumerate(new_tweets, start=start_index + 1):
-        print(f"  处理 {i-start_index}/{len(new_tweets)}: @{tweet['user_screen_name']}")
-        tweet["fetched_at"] = datetime.now().isoformat()
-
-        # Generate filename: HHMMSS_username_id.md
-        try:
-            created_dt = datetime.fromisoformat(tweet["created_at"])
-        except Exception:
-            created_dt = datetime.now()
-        time_str = created_dt.strftime("%H%M%S")
-        username = sanitize_filename(tweet["user_screen_name"])
-        clean_id = clean_tweet_id(tweet["id"])
-        filename = f"{i}_{username}_{clean_id}.md"
-        output_file = date_dir / filename
-
-        # Convert tweet to markdown and save
-        markdown_content = tweet_to_markdown(tweet)
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
-        existing_ids.add(tweet["id"])
+    # One save timestamp for the whole batch; each saved id is appended to
+    # the log right after its file is written
+    fetched_at = datetime.now().isoformat()
+    with ID_LOG_FILE.open("a", encoding="utf-8") as id_log:
+        for i, tweet in enumerate(new_tweets, start=start_index + 1):
+            print(f"  处理 {i-start_index}/{len(new_tweets)}: @{tweet['user_screen_name']}")
+            tweet["fetched_at"] = fetched_at
+
+            # Generate filename: index_username_id.md
+            username = sanitize_filename(tweet["user_screen_name"])
+            clean_id = clean_tweet_id(tweet["id"])
+            filename = f"{i}_{username}_{clean_id}.md"
+            output_file = date_dir / filename
+
+            # Convert tweet to markdown and save
+            markdown_content = tweet_to_markdown(tweet)
+            _atomic_write(output_file, markdown_content.encode("utf-8"))
+            existing_ids.add(tweet["id"])
+            id_log.write(f"{tweet['id']}\n")
+            id_log.flush()
 
     print(f"\n已保存到: {date_dir}")
     print(f"新增: {len(new_tweets)} 条")
 
-    # Count total tweets in date directory
-    total_count = len(list(date_dir.glob("*.md")))
+    # Count total tweets in date directory (new files never reuse an index)
+    total_count = len(existing_files) + len(new_tweets)
     print(f"目录总计: {total_count} 条")
 
-    save_cached_ids(existing_ids)
     return len(new_tweets), total_count
 
 